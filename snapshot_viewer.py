@@ -6,15 +6,36 @@ A Streamlit application for viewing and operating on locally stored snapshots.
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import json
-import plotly.express as px
-import plotly.graph_objects as go
+import gzip
+import codecs
+import mmap
 from pathlib import Path
 import os
 from datetime import datetime
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing and record serialization
+    orjson = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # Optional: Parquet copies of downloaded snapshots
+    pyarrow = None
 
 # Add the util directory to the path
 sys.path.append(str(Path(__file__).parent / "util"))
@@ -35,7 +56,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -63,64 +84,230 @@ st.markdown("""
     .status-failed { background-color: #f8d7da; color: #721c24; border-color: #f5c6cb; }
     .status-submitted { background-color: #cce5ff; color: #004085; border-color: #b3d9ff; }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# The style block is re-sent with every rerun, so send it without indentation
+st.markdown(" ".join(CUSTOM_CSS.split()), unsafe_allow_html=True)
+
+# Plain-text bodies the API returns instead of data while a snapshot isn't ready
+SNAPSHOT_STATUS_MESSAGES = (
+    "Snapshot is building. Try again in a few minutes",
+    "Snapshot not ready",
+    "Snapshot is processing",
+    "No data available",
+)
+
+# Statuses that still need to be polled from the API
+PENDING_STATUSES = frozenset({'submitted', 'processing', 'scheduled', 'unknown'})
+
+# Downloaded data formats, in lookup order (Parquet is memory-mapped on read)
+SNAPSHOT_DATA_EXTENSIONS = ('.parquet', '.json', '.csv', '.json.gz', '.csv.gz')
+
+# Badge class and icon per status, shared by the sidebar and the details badge
+STATUS_CONFIG = {
+    'completed': {'class': 'status-completed', 'icon': '✅'},
+    'ready': {'class': 'status-completed', 'icon': '✅'},
+    'processing': {'class': 'status-processing', 'icon': '⏳'},
+    'building': {'class': 'status-processing', 'icon': '🔨'},
+    'submitted': {'class': 'status-submitted', 'icon': '📤'},
+    'failed': {'class': 'status-failed', 'icon': '❌'}
+}
+DEFAULT_STATUS_CONFIG = {'class': 'status-submitted', 'icon': '📋'}
+STATUS_ICONS = {status: config['icon'] for status, config in STATUS_CONFIG.items()}
+
+# Concurrent status lookups; matches the HTTP session's connection pool size
+STATUS_POLL_WORKERS = 16
+
+# Minimum seconds between automatic status polls, shared by all sessions
+STATUS_CHECK_INTERVAL = 30
+
+# Records the last poll time so new tabs and restarts don't poll again right away
+LAST_CHECK_FILE = Path("snapshot_records") / ".last_check"
+
+# Snapshots shown per sidebar page; Streamlit rebuilds every widget on each rerun
+SIDEBAR_PAGE_SIZE = 25
+
+# Limits on what the analysis pane sends to the browser
+PREVIEW_MAX_ROWS = 10_000
+CHART_SAMPLE_ROWS = 50_000  # WebGL scatter stays interactive well past this
+HISTOGRAM_BINS = 50
 
 def load_snapshot_records():
-    """Load all snapshot records from the snapshot_records directory."""
+    """
+    Load all snapshot records from the snapshot_records directory.
+    The directory scan runs on every call; records are only parsed again when
+    a file is added, removed or rewritten (see _load_records_cached).
+    """
     records_dir = Path("snapshot_records")
     if not records_dir.exists():
         return []
     
+    # Any added, removed or rewritten record changes the signature and misses the cache.
+    # scandir's DirEntry skips directories via d_type and caches its stat result.
+    signature = []
+    with os.scandir(records_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.is_file():
+                stat = entry.stat()
+                signature.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    
+    return _load_records_cached(tuple(sorted(signature)))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_records_cached(mtime_signature):
+    """Parse all snapshot records; cached on the directory's (name, mtime, size) signature."""
     records = []
-    for file_path in records_dir.glob("*.json"):
+    for name, _, size in mtime_signature:
+        # Plain strings; no Path object per record on the hot path
+        file_path = os.path.join("snapshot_records", name)
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            data = _load_record(file_path, size)
+            
+            # Handle both list and dictionary formats
+            if isinstance(data, list):
+                # If it's a list, create a summary record
+                record = {
+                    'snapshot_id': os.path.splitext(name)[0],
+                    'submission_time': '2025-01-01T00:00:00.000000',  # Default timestamp
+                    'dataset_id': 'unknown',
+                    'status': 'ready',
+                    'records_count': len(data),
+                    'file_type': 'data_list'
+                }
+            elif isinstance(data, dict):
+                # If it's a dictionary, use it as is
+                record = data
+                # Older viewer versions persisted the path; it is derived from the ID now
+                record.pop('file_path', None)
+            else:
+                # Skip unknown formats
+                continue
                 
-                # Handle both list and dictionary formats
-                if isinstance(data, list):
-                    # If it's a list, create a summary record
-                    record = {
-                        'snapshot_id': file_path.stem,
-                        'submission_time': '2025-01-01T00:00:00.000000',  # Default timestamp
-                        'dataset_id': 'unknown',
-                        'status': 'ready',
-                        'records_count': len(data),
-                        'file_type': 'data_list',
-                        'file_path': str(file_path)
-                    }
-                elif isinstance(data, dict):
-                    # If it's a dictionary, use it as is
-                    record = data.copy()
-                    record['file_path'] = str(file_path)
-                else:
-                    # Skip unknown formats
-                    continue
-                    
-                records.append(record)
-        except (json.JSONDecodeError, KeyError, TypeError):
+            _add_derived_fields(record)
+            records.append(record)
+        except (ValueError, KeyError, TypeError, FileNotFoundError):
+            # ValueError covers both json.JSONDecodeError and orjson.JSONDecodeError;
+            # FileNotFoundError covers records deleted since the directory was scanned
             continue
     
-    return sorted(records, key=lambda x: x.get('submission_time', ''), reverse=True)
+    # Newest first; records without a parseable time sort last. Sorted once per
+    # cache miss, in place, on the precomputed timestamp
+    records.sort(key=itemgetter('_submission_ts'), reverse=True)
+    return records
+
+def _add_derived_fields(record):
+    """
+    Precompute the sidebar's display values once at load so reruns only format.
+    Underscore-prefixed fields are display-only and never written back to disk.
+    """
+    filter_criteria = record.get('filter_criteria')
+    if isinstance(filter_criteria, dict) and 'filters' in filter_criteria:
+        record['_filter_count'] = len(filter_criteria['filters'])
+    else:
+        record['_filter_count'] = 1 if filter_criteria else 0
+    record['_records_limit_str'] = str(record.get('records_limit', 'N/A'))
+    
+    submission_time = record.get('submission_time')
+    try:
+        submission_dt = datetime.fromisoformat(submission_time.replace('Z', '+00:00')) if submission_time else None
+    except (ValueError, AttributeError):
+        submission_dt = None
+    # A float sorts faster than a datetime and is cheaper to copy out of the cache;
+    # timestamp() also makes naive and timezone-aware times comparable
+    record['_submission_ts'] = submission_dt.timestamp() if submission_dt is not None else float('-inf')
+    if submission_dt is not None:
+        record['_date_str'] = submission_dt.strftime('%Y-%m-%d %H:%M:%S')
+    else:
+        record['_date_str'] = submission_time or 'Unknown'
+    
+    # Use the snapshot ID as the title fallback
+    record['_title'] = record.get('title', f"Snapshot {record['snapshot_id'][:12]}...")
+
+@st.cache_resource(show_spinner=False)
+def get_brightdata(dataset_id):
+    """One BrightDataFilter per dataset, shared across reruns and sessions."""
+    return BrightDataFilter(dataset_id)
 
 def check_snapshot_status(snapshot_id, dataset_id):
     """Check the current status of a snapshot from the API."""
     try:
-        brightdata = BrightDataFilter(dataset_id)
+        brightdata = get_brightdata(dataset_id)
         metadata = brightdata.get_snapshot_metadata(snapshot_id)
         return metadata
     except Exception as e:
         print(f"Error checking status for {snapshot_id}: {e}")
         return None
 
-def update_snapshot_status(record):
-    """Update the status of a snapshot record if it's not completed."""
+def _record_path(snapshot_id):
+    """Path of a snapshot's record file; records are stored as ``<snapshot_id>.json``."""
+    return os.path.join("snapshot_records", f"{snapshot_id}.json")
+
+def _load_record(path, size=None, mmap_threshold=1 << 12):
+    """
+    Read and parse a snapshot record file. With orjson, records larger than
+    ``mmap_threshold`` bytes are parsed straight from a memory map instead of
+    being copied into a bytes object first. Pass ``size`` when it is already
+    known from a directory scan to skip the fstat.
+    """
+    with open(path, 'rb') as f:
+        if orjson is None:
+            return json.loads(f.read())
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size < mmap_threshold:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+def _serialize_record(record):
+    """Serialize a snapshot record to compact JSON bytes, dropping derived ``_`` fields."""
+    record = {key: value for key, value in record.items() if not key.startswith('_')}
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _dump_record(path, record):
+    """
+    Write a snapshot record atomically, skipping the write when the file already
+    holds identical content. Returns True if the file was rewritten.
+    """
+    path = Path(path)
+    blob = _serialize_record(record)
+    try:
+        if path.read_bytes() == blob:
+            return False
+    except FileNotFoundError:
+        pass
+    
+    tmp_path = path.with_suffix('.json.tmp')
+    tmp_path.write_bytes(blob)
+    os.replace(tmp_path, path)
+    return True
+
+def _is_pollable(record):
+    """
+    True for pending records the API can answer for. Records whose ID is not a
+    BrightData snapshot ID (e.g. plain data-list files) would only ever 404.
+    """
+    return (
+        record.get('status', 'submitted') in PENDING_STATUSES
+        and str(record.get('snapshot_id', '')).startswith('snap_')
+    )
+
+def update_snapshot_status(record, metadata=None, save=True):
+    """
+    Update the status of a snapshot record if it's not completed.
+    Pass ``metadata`` when it has already been fetched to skip the API call,
+    and ``save=False`` to leave writing the record to the caller.
+    """
     current_status = record.get('status', 'submitted')  # Default to submitted instead of unknown
     
     # Check status for non-completed snapshots or unknown status
-    if current_status in ['submitted', 'processing', 'scheduled', 'unknown']:
+    if _is_pollable(record):
         try:
-            metadata = get_snapshot_metadata(record['snapshot_id'])
+            if metadata is None:
+                metadata = get_snapshot_metadata(record['snapshot_id'])
             if metadata:
                 new_status = metadata.get('status', current_status)
                 
@@ -145,8 +332,9 @@ def update_snapshot_status(record):
                         record['completion_time'] = metadata['completion_time']
                     
                     # Save updated record back to file
-                    with open(record['file_path'], 'w') as f:
-                        json.dump(record, f, indent=2)
+                    if save:
+                        _dump_record(_record_path(record['snapshot_id']), record)
+                        _fetch_metadata_cached.clear()
                     
                     return True
         except Exception as e:
@@ -155,69 +343,417 @@ def update_snapshot_status(record):
     
     return False
 
-def get_snapshot_status_badge(status):
-    """Get a styled status badge with icon."""
-    status_config = {
-        'completed': {'class': 'status-completed', 'icon': '✅'},
-        'ready': {'class': 'status-completed', 'icon': '✅'},
-        'processing': {'class': 'status-processing', 'icon': '⏳'},
-        'building': {'class': 'status-processing', 'icon': '🔨'},
-        'submitted': {'class': 'status-submitted', 'icon': '📤'},
-        'failed': {'class': 'status-failed', 'icon': '❌'}
-    }
+def update_snapshot_statuses(records, max_workers=STATUS_POLL_WORKERS, session=None):
+    """
+    Update all pending records with one concurrent round of API calls.
+    Returns the number of records whose status changed. Pass ``session`` when
+    calling from outside the script thread. Callers on the script thread clear
+    ``_fetch_metadata_cached`` when the count is non-zero; this function makes
+    no st.* calls so it can run on a worker.
+    """
+    pending = [r for r in records if _is_pollable(r)]
+    if not pending:
+        return 0
+    # The metadata endpoint has no bulk form, so each distinct ID is one request
+    # on the shared session, whatever dataset it belongs to
+    snapshot_ids = list(dict.fromkeys(r['snapshot_id'] for r in pending))
+    metadata_by_id = _fetch_metadata_batch(snapshot_ids, max_workers, session)
     
-    config = status_config.get(status, {'class': 'status-submitted', 'icon': '📋'})
+    changed = [
+        record for record in pending
+        if record['snapshot_id'] in metadata_by_id
+        and update_snapshot_status(record, metadata_by_id[record['snapshot_id']], save=False)
+    ]
+    
+    # Flush all changed records in one pass once polling is done
+    for record in changed:
+        _dump_record(_record_path(record['snapshot_id']), record)
+    return len(changed)
+
+@st.cache_resource
+def _global_throttle():
+    """Process-wide poll bookkeeping, shared by every browser session."""
+    return {'last_check': 0.0, 'lock': threading.Lock()}
+
+def _status_check_due(interval=STATUS_CHECK_INTERVAL):
+    """True if no session or earlier process has polled statuses within ``interval`` seconds."""
+    throttle = _global_throttle()
+    now = time.time()
+    if now - throttle['last_check'] < interval:
+        return False
+    try:
+        throttle['last_check'] = max(throttle['last_check'], float(LAST_CHECK_FILE.read_text()))
+    except (OSError, ValueError):
+        pass
+    return now - throttle['last_check'] >= interval
+
+def _mark_status_checked(throttle):
+    """Record a completed status poll in memory and on disk."""
+    now = time.time()
+    throttle['last_check'] = now
+    try:
+        LAST_CHECK_FILE.write_text(str(now))
+    except OSError:
+        pass
+
+def poll_snapshot_statuses(records, throttle, session=None):
+    """
+    Poll pending records unless another poll is already in flight in this process.
+    Returns the number of changed records, or None when skipped. The poll time is
+    stamped after the poll finishes, so a slow poll pushes the next one back
+    instead of letting them stack up.
+    """
+    if not throttle['lock'].acquire(blocking=False):
+        return None
+    try:
+        return update_snapshot_statuses(records, session=session)
+    finally:
+        _mark_status_checked(throttle)
+        throttle['lock'].release()
+
+def _start_background_status_check(records):
+    """
+    Run the startup status poll on a daemon thread so the page renders straight
+    away. Returns ``(thread, result)``; ``result['updated']`` is set when it finishes.
+    """
+    # Resolved on the script thread; the worker must not call st.* functions
+    throttle = _global_throttle()
+    session = _get_http_session()
+    # Poll copies so the page being rendered never sees records change mid-run
+    pending = [dict(r) for r in records if _is_pollable(r)]
+    result = {}
+    
+    def run():
+        result['updated'] = poll_snapshot_statuses(pending, throttle, session)
+    
+    thread = threading.Thread(target=run, name="snapshot-status-check", daemon=True)
+    thread.start()
+    return thread, result
+
+def _fetch_metadata_batch(snapshot_ids, max_workers=STATUS_POLL_WORKERS, session=None):
+    """Fetch metadata for several snapshots in parallel; failed lookups are left out."""
+    if not snapshot_ids:
+        return {}
+    
+    if session is None:
+        try:
+            session = _get_http_session()
+        except Exception:
+            return {}
+    
+    def fetch(snapshot_id):
+        try:
+            return _request_snapshot_metadata(snapshot_id, session)
+        except Exception:
+            # Don't report per-snapshot errors to avoid cluttering the UI
+            return None
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(snapshot_ids))) as executor:
+        results = executor.map(fetch, snapshot_ids)
+        return {sid: metadata for sid, metadata in zip(snapshot_ids, results) if metadata}
+
+@lru_cache(maxsize=32)
+def get_snapshot_status_badge(status):
+    """Get a styled status badge with icon; the HTML is built once per status."""
+    config = STATUS_CONFIG.get(status, DEFAULT_STATUS_CONFIG)
     return f'<span class="status-badge {config["class"]}">{config["icon"]} {status.upper()}</span>'
 
-def load_snapshot_data(snapshot_id):
-    """Load the actual data for a snapshot (supports multiple formats)."""
-    downloads_dir = Path("data/downloads")
+def _read_json_array_head(f, n, chunk_size=1 << 16):
+    """
+    Decode the first ``n`` objects of a JSON array without parsing the rest of the file.
+    Raises ValueError if the text doesn't start with an array.
+    """
+    decoder = json.JSONDecoder()
+    buffer = f.read(chunk_size).lstrip('\ufeff \t\r\n')
+    if not buffer.startswith('['):
+        raise ValueError("Not a JSON array")
+    buffer = buffer[1:]  # Skip the opening bracket
+    rows = []
+    
+    while len(rows) < n:
+        buffer = buffer.lstrip().lstrip(',').lstrip()
+        if not buffer or buffer.startswith(']'):
+            more = f.read(chunk_size) if not buffer else ''
+            if not more:
+                break
+            buffer += more
+            continue
+        try:
+            obj, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:
+            # Object spans the chunk boundary - read more and retry
+            more = f.read(chunk_size)
+            if not more:
+                break
+            buffer += more
+            continue
+        rows.append(obj)
+        buffer = buffer[end:]
     
-    # Check for different file formats
-    for ext in ['.json', '.csv', '.json.gz', '.csv.gz']:
+    return rows
+
+def find_snapshot_data_file(snapshot_id):
+    """
+    Locate a snapshot's downloaded data file.
+    Returns a ``(path, ext, mtime_ns, size)`` signature, or None if nothing was downloaded.
+    The signature keys the data caches, so re-downloading a snapshot invalidates them.
+    """
+    downloads_dir = Path("data/downloads")
+    found = []
+    for ext in SNAPSHOT_DATA_EXTENSIONS:
         data_file = downloads_dir / f"{snapshot_id}{ext}"
-        if data_file.exists():
-            try:
-                # First, check if the file contains valid data
-                with open(data_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                
-                # Check if the content is a status message instead of data
-                if content in ["Snapshot is building. Try again in a few minutes", 
-                              "Snapshot not ready", 
-                              "Snapshot is processing",
-                              "No data available"]:
-                    st.warning(f"⚠️ {content}")
-                    return None
-                
-                # Check if the file is empty
-                if not content:
-                    st.warning("⚠️ Downloaded file is empty")
-                    return None
-                
-                # Try to load the data based on format
-                if ext == '.json':
-                    return pd.read_json(data_file)
-                elif ext == '.csv':
-                    return pd.read_csv(data_file)
-                elif ext == '.json.gz':
-                    return pd.read_json(data_file, compression='gzip')
-                elif ext == '.csv.gz':
-                    return pd.read_csv(data_file, compression='gzip')
-                    
-            except pd.errors.EmptyDataError:
-                st.warning("⚠️ Downloaded file contains no data")
-                return None
-            except pd.errors.JSONDecodeError as e:
-                st.error(f"❌ Invalid JSON format in {data_file}: {e}")
-                st.info("💡 The snapshot might still be building. Try downloading again later.")
-                return None
-            except Exception as e:
-                st.error(f"❌ Error loading data from {data_file}: {e}")
+        try:
+            stat = data_file.stat()
+        except FileNotFoundError:
+            continue
+        found.append((str(data_file), ext, stat.st_mtime_ns, stat.st_size))
+    if not found:
+        return None
+    
+    # A Parquet copy is only used while it is at least as new as every download
+    if found[0][1] == '.parquet' and len(found) > 1:
+        if found[0][2] < max(signature[2] for signature in found[1:]):
+            return found[1]
+    return found[0]
+
+def load_snapshot_head(snapshot_id, n=10):
+    """
+    Load only the first ``n`` rows of a snapshot for a quick preview.
+    Returns None when no readable data file exists; load_snapshot_data reports the details.
+    """
+    data_signature = find_snapshot_data_file(snapshot_id)
+    if data_signature is None:
+        return None
+    return _load_head_cached(data_signature, n)
+
+@st.cache_data(show_spinner=False)
+def _load_head_cached(data_signature, n):
+    """Preview rows for one version of a data file, keyed on its signature."""
+    path, ext, _, _ = data_signature
+    data_file = Path(path)
+    if ext == '.parquet':
+        try:
+            return _read_parquet_head(data_file, n)
+        except Exception:
+            return None
+    
+    opener = gzip.open if ext.endswith('.gz') else open
+    try:
+        # utf-8-sig drops a leading byte order mark
+        with opener(data_file, 'rt', encoding='utf-8-sig') as f:
+            start = f.read(4096)
+            stripped = start.strip()
+            if not stripped or stripped in SNAPSHOT_STATUS_MESSAGES:
                 return None
     
+            if ext.startswith('.csv'):
+                f.seek(0)
+                return pd.read_csv(f, nrows=n)
+    
+            if stripped.startswith('['):
+                f.seek(0)
+                return pd.DataFrame.from_records(_read_json_array_head(f, n))
+            
+            f.seek(0)
+            if _is_json_lines(f):
+                f.seek(0)
+                return pd.read_json(f, lines=True, nrows=n)
+        
+        # Anything else (e.g. a single object) goes through the full parser,
+        # like load_snapshot_data
+        return _read_json_snapshot(data_file, compressed=ext.endswith('.gz')).head(n)
+    except Exception:
+        return None
+
+def _read_parquet_head(data_file, n):
+    """First ``n`` rows of a Parquet file, decoding only the leading row group(s)."""
+    if pyarrow is None:
+        return pd.read_parquet(data_file, memory_map=True).head(n)
+    parquet_file = pyarrow.parquet.ParquetFile(data_file, memory_map=True)
+    batch = next(parquet_file.iter_batches(batch_size=n), None)
+    if batch is None:
+        return parquet_file.schema_arrow.empty_table().to_pandas()
+    return pyarrow.Table.from_batches([batch]).to_pandas()
+
+def _is_json_lines(f):
+    """
+    True if the text holds one JSON object per line. A pretty-printed or
+    single-line document fails this: its first line isn't a complete object
+    or nothing follows it.
+    """
+    first = f.readline().strip()
+    if not first.startswith('{'):
+        return False
+    try:
+        json.loads(first)
+    except ValueError:
+        return False
+    second = f.readline().strip()
+    return second.startswith('{')
+
+def _read_json_snapshot(data_file, compressed=False):
+    """Parse a JSON snapshot with orjson when it is installed, otherwise with pandas."""
+    if orjson is None:
+        return pd.read_json(data_file, compression='gzip' if compressed else None)
+    
+    raw = data_file.read_bytes()
+    if compressed:
+        raw = gzip.decompress(raw)
+    payload = orjson.loads(raw.removeprefix(codecs.BOM_UTF8))
+    if isinstance(payload, list):
+        return pd.DataFrame.from_records(payload)
+    return pd.json_normalize(payload)
+
+def load_snapshot_data(snapshot_id):
+    """Load the actual data for a snapshot (supports multiple formats)."""
+    data_signature = find_snapshot_data_file(snapshot_id)
+    if data_signature is None:
+        return None
+    return _load_data_cached(data_signature)
+
+@st.cache_data(show_spinner=False)
+def _load_data_cached(data_signature):
+    """
+    Parse one version of a data file. Keyed on path, mtime and size, so reruns
+    skip parsing and a re-downloaded file is parsed afresh.
+    """
+    path, ext, _, _ = data_signature
+    data_file = Path(path)
+    try:
+        if ext == '.parquet':
+            # Map column pages instead of copying them into process memory
+            return pd.read_parquet(data_file, memory_map=True)
+    
+        # First, check if the file contains valid data; status messages are
+        # short, so peeking at the start avoids holding the file as a string
+        opener = gzip.open if ext.endswith('.gz') else open
+        with opener(data_file, 'rt', encoding='utf-8') as f:
+            content = f.read(4096).strip()
+    
+        # Check if the content is a status message instead of data
+        if content in SNAPSHOT_STATUS_MESSAGES:
+            st.warning(f"⚠️ {content}")
+            return None
+    
+        # Check if the file is empty
+        if not content:
+            st.warning("⚠️ Downloaded file is empty")
+            return None
+    
+        # Try to load the data based on format
+        df = None
+        if ext == '.json':
+            df = _read_json_snapshot(data_file)
+        elif ext == '.csv':
+            df = pd.read_csv(data_file)
+        elif ext == '.json.gz':
+            df = _read_json_snapshot(data_file, compressed=True)
+        elif ext == '.csv.gz':
+            df = pd.read_csv(data_file, compression='gzip')
+        
+        if df is not None and not df.empty:
+            _write_parquet_copy(df, Path(path[:-len(ext)] + '.parquet'))
+        return df
+    
+    except pd.errors.EmptyDataError:
+        st.warning("⚠️ Downloaded file contains no data")
+        return None
+    except pd.errors.JSONDecodeError as e:
+        st.error(f"❌ Invalid JSON format in {data_file}: {e}")
+        st.info("💡 The snapshot might still be building. Try downloading again later.")
+        return None
+    except Exception as e:
+        st.error(f"❌ Error loading data from {data_file}: {e}")
+        return None
+    
     return None
 
+def _write_parquet_copy(df, parquet_file):
+    """
+    Save a parsed snapshot as zstd-compressed Parquet next to the download, so
+    later loads memory-map it instead of re-parsing JSON/CSV. Best effort:
+    frames pyarrow can't represent (e.g. mixed-type columns) are left as-is.
+    """
+    if pyarrow is None:
+        return
+    tmp_file = parquet_file.with_suffix('.parquet.tmp')
+    try:
+        df.to_parquet(tmp_file, engine='pyarrow', compression='zstd')
+        os.replace(tmp_file, parquet_file)
+    except Exception:
+        tmp_file.unlink(missing_ok=True)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def top_values(data_signature, col, n=10):
+    """Return the ``n`` most frequent values of a snapshot column, cached per column."""
+    df = _load_data_cached(data_signature)
+    return df[col].value_counts().head(n)
+
+@st.cache_data(show_spinner=False)
+def _column_info(df_signature, dtype_names, _df):
+    """
+    Per-column dtype and null counts, cached on a cheap frame signature.
+    The frame itself is excluded from hashing (leading underscore).
+    """
+    # One null scan serves all three count columns. Counting column by column
+    # never materializes a full boolean mask of the frame, and plain arrays
+    # avoid per-column index alignment when building the result
+    n = len(_df)
+    nulls = np.fromiter(
+        (column.isna().sum() for _, column in _df.items()), dtype=np.int64, count=_df.shape[1]
+    )
+    return pd.DataFrame({
+        'Column': _df.columns.to_numpy(),
+        'Type': np.asarray(dtype_names, dtype=object),
+        'Non-Null Count': n - nulls,
+        'Null Count': nulls,
+        'Null %': nulls * (100.0 / max(n, 1))
+    }, copy=False)
+
+@st.cache_data(show_spinner=False)
+def _classify_columns(df_signature, dtype_names, _dtypes):
+    """
+    Split columns into numeric (excluding bool) and categorical lists.
+    Cached on the frame signature plus dtype names, so a re-downloaded file is reclassified.
+    """
+    is_num = _dtypes.map(
+        lambda t: pd.api.types.is_numeric_dtype(t) and not pd.api.types.is_bool_dtype(t)
+    ).astype(bool)
+    is_cat = ~is_num & pd.Series(dtype_names, index=_dtypes.index).isin(['object', 'string', 'category'])
+    return _dtypes.index[is_num].tolist(), _dtypes.index[is_cat].tolist()
+
+@st.cache_data(show_spinner=False)
+def _describe(df_signature, _df, numeric_cols):
+    """Statistical summary of the numeric columns, cached like _column_info."""
+    return _df[numeric_cols].describe()
+
+@st.cache_data(show_spinner=False)
+def _histogram_bins(df_signature, _df, col, bins=HISTOGRAM_BINS):
+    """Bin a numeric column server-side so the chart only ships ``bins`` bars."""
+    values = _df[col].dropna().to_numpy(dtype=float)
+    values = values[np.isfinite(values)]
+    counts, edges = np.histogram(values, bins=bins)
+    return pd.DataFrame({
+        col: (edges[:-1] + edges[1:]) / 2,
+        'count': counts,
+        'width': np.diff(edges),
+    })
+
+@st.cache_data(show_spinner=False)
+def _chart_sample(df_signature, _df, cols, max_rows=CHART_SAMPLE_ROWS):
+    """Fixed random sample of the plotted columns, capped at ``max_rows``."""
+    if len(_df) <= max_rows:
+        return _df[cols]
+    return _df[cols].sample(max_rows, random_state=0)
+
+@st.cache_data(show_spinner=False)
+def _memory_usage_mb(df_signature, _df, deep=False):
+    """
+    Memory usage in MB, cached per snapshot. ``deep=True`` inspects every object
+    cell, so it is only computed when asked for.
+    """
+    return _df.memory_usage(deep=deep).sum() / 1024 / 1024
+
 def delete_snapshot_record(snapshot_id):
     """Delete a snapshot record and its associated files."""
     try:
@@ -228,7 +764,7 @@ def delete_snapshot_record(snapshot_id):
         
         # Delete the downloaded data file if it exists (check all formats)
         downloads_dir = Path("data/downloads")
-        for ext in ['.json', '.csv', '.json.gz', '.csv.gz']:
+        for ext in SNAPSHOT_DATA_EXTENSIONS:
             data_file = downloads_dir / f"{snapshot_id}{ext}"
             if data_file.exists():
                 data_file.unlink()
@@ -248,8 +784,7 @@ def update_manual_snapshot_status(snapshot_id):
             # Update the record with new status and metadata
             record_file = Path("snapshot_records") / f"{snapshot_id}.json"
             if record_file.exists():
-                with open(record_file, 'r') as f:
-                    record = json.load(f)
+                record = _load_record(record_file)
                 
                 # Update status and metadata with all available information
                 record['status'] = metadata.get('status', 'unknown')
@@ -273,8 +808,8 @@ def update_manual_snapshot_status(snapshot_id):
                     record['filter_criteria']['status_checked'] = True
                 
                 # Save updated record
-                with open(record_file, 'w') as f:
-                    json.dump(record, f, indent=2)
+                if _dump_record(record_file, record):
+                    _fetch_metadata_cached.clear()
                 
                 return True
         return False
@@ -282,27 +817,49 @@ def update_manual_snapshot_status(snapshot_id):
         st.error(f"Error updating snapshot status: {e}")
         return False
 
+@st.cache_resource
+def _get_http_session():
+    """
+    Shared HTTP session for BrightData API calls.
+    Kept across reruns so requests reuse pooled keep-alive connections.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=STATUS_POLL_WORKERS,
+        pool_maxsize=STATUS_POLL_WORKERS,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504])
+    ))
+    session.headers.update({
+        "Authorization": f"Bearer {get_brightdata_api_key()}",
+        "Content-Type": "application/json"
+    })
+    return session
+
+def _request_snapshot_metadata(snapshot_id, session=None):
+    """
+    Fetch snapshot metadata from the API, raising on failure.
+    Worker threads should pass in a session obtained on the script thread.
+    """
+    session = session or _get_http_session()
+    response = session.get(
+        f"https://api.brightdata.com/datasets/snapshots/{snapshot_id}",
+        timeout=30
+    )
+    response.raise_for_status()
+    return response.json()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_metadata_cached(snapshot_id):
+    """Snapshot metadata memoized for 30 seconds, matching the auto-refresh cadence."""
+    return _request_snapshot_metadata(snapshot_id)
+
 def get_snapshot_metadata(snapshot_id):
     """
     Get snapshot metadata from BrightData API.
     This is a utility function that doesn't require a dataset ID.
     """
     try:
-        from util.config import get_brightdata_api_key
-        api_key = get_brightdata_api_key()
-        
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.get(
-            f"https://api.brightdata.com/datasets/snapshots/{snapshot_id}",
-            headers=headers,
-            timeout=30
-        )
-        response.raise_for_status()
-        return response.json()
+        return _fetch_metadata_cached(snapshot_id)
     except Exception as e:
         st.error(f"Error retrieving snapshot metadata: {e}")
         return None
@@ -327,6 +884,256 @@ def get_snapshot_filter_details(snapshot_id):
         st.error(f"Error retrieving filter details: {e}")
         return None
 
+@st.fragment
+def _download_panel(selected_record):
+    """
+    Render the download form for a snapshot without local data.
+    Runs as a fragment so form interactions don't rerun the whole page.
+    """
+    snapshot_id = selected_record['snapshot_id']
+    
+    # Download form with snapshot ID requirement
+    with st.form(f"download_form_{snapshot_id}"):
+        st.write("**📥 Download Snapshot Data**")
+        st.write("⚠️ **Important**: Downloading data incurs costs. Only download when needed.")
+
+
+        # Pre-fill with current snapshot ID
+        download_snapshot_id = st.text_input(
+            "Snapshot ID to Download",
+            value=snapshot_id,
+            help="Enter the snapshot ID you want to download. This will incur costs.",
+            disabled=True  # Pre-filled and disabled to prevent mistakes
+        )
+
+        # Download options
+        download_format = st.selectbox(
+            "Download Format",
+            options=["json", "csv"],
+            index=0,
+            help="Choose the format for downloaded data"
+        )
+
+        compress_data = st.checkbox(
+            "Compress Download",
+            value=False,
+            help="Compress the downloaded file to reduce size"
+        )
+
+        col_download1, col_download2 = st.columns(2)
+        with col_download1:
+            download_submitted = st.form_submit_button(
+                "📥 Download Data",
+                type="primary",
+                help="This will download the snapshot data and may incur costs"
+            )
+
+        with col_download2:
+            if st.form_submit_button("❌ Cancel"):
+                st.rerun(scope="fragment")
+
+        # Handle download
+        if download_submitted:
+            if not download_snapshot_id or not download_snapshot_id.strip():
+                st.error("❌ Snapshot ID is required for download")
+                st.info("💡 Please provide a valid snapshot ID to proceed")
+                return
+
+            # Additional validation
+            if not download_snapshot_id.startswith('snap_'):
+                st.error("❌ Invalid snapshot ID format")
+                st.info("💡 Snapshot ID should start with 'snap_'")
+                return
+
+            try:
+                # Initialize BrightData filter
+                dataset_id = selected_record.get('dataset_id')
+                if not dataset_id:
+                    st.error("❌ No dataset ID found in record")
+                    return
+
+                brightdata = get_brightdata(dataset_id)
+
+                # Show download progress
+                with st.spinner(f"Downloading {download_snapshot_id} in {download_format.upper()} format..."):
+                    # Download the snapshot content
+                    response = brightdata.download_snapshot_content(
+                        download_snapshot_id,
+                        format=download_format,
+                        compress=compress_data
+                    )
+
+                    if response.status_code == 200:
+                        # Stream the body in 1 MB chunks; status messages fit in the first one
+                        chunks = response.iter_content(chunk_size=1 << 20)
+                        first_chunk = next(chunks, b"")
+                        content = first_chunk[:4096].decode('utf-8', errors='ignore').strip()
+
+                        # Check for status messages
+                        if len(first_chunk) <= 4096 and content in SNAPSHOT_STATUS_MESSAGES:
+                            st.warning(f"⚠️ {content}")
+                            st.info("💡 The snapshot is still being processed. Please wait and try again later.")
+                            return
+
+                        # Save the downloaded data
+                        downloads_dir = Path("data/downloads")
+                        downloads_dir.mkdir(exist_ok=True)
+
+                        file_extension = f".{download_format}"
+                        if compress_data:
+                            file_extension += ".gz"
+
+                        file_path = downloads_dir / f"{download_snapshot_id}{file_extension}"
+
+                        bytes_written = 0
+                        with open(file_path, 'wb') as f:
+                            for chunk in chain((first_chunk,), chunks):
+                                f.write(chunk)
+                                bytes_written += len(chunk)
+
+                        # Update the record to mark as downloaded
+                        record_file = Path("snapshot_records") / f"{download_snapshot_id}.json"
+                        if record_file.exists():
+                            record = _load_record(record_file)
+
+                            record['downloaded'] = True
+                            record['download_time'] = datetime.now().isoformat()
+                            record['download_format'] = download_format
+                            record['download_file'] = str(file_path)
+
+                            _dump_record(record_file, record)
+
+                        st.success(f"✅ Successfully downloaded {download_snapshot_id}!")
+                        st.info(f"📁 File saved to: `{file_path}`")
+                        st.info(f"📊 Size: {bytes_written / 1024 / 1024:.2f} MB")
+
+                        # Refresh the page to show updated status
+                        st.rerun()
+
+                    else:
+                        st.error(f"❌ Download failed: HTTP {response.status_code}")
+                        # Only read the start of the body; error pages can be large
+                        err_snippet = next(response.iter_content(4096, decode_unicode=True), "")
+                        if err_snippet:
+                            st.error(f"Error details: {err_snippet}")
+
+            except Exception as e:
+                st.error(f"❌ Download error: {str(e)}")
+                st.info("💡 Make sure the snapshot is ready and you have sufficient credits")
+
+@st.fragment
+def _filter_criteria_panel(selected_record):
+    """
+    Render the filter criteria of a snapshot.
+    Static text is batched into as few markdown calls as possible.
+    """
+    st.subheader("🔍 Filter Criteria")
+    fc = selected_record.get('filter_criteria', {})
+    if not fc:
+        st.info("No filter criteria available")
+        return
+    
+    if not fc.get('manual_entry'):
+        # Show description if available
+        description = selected_record.get('description')
+        if description:
+            st.markdown(f"**Description:** {description}\n\n---")
+        st.json(fc)
+        return
+    
+    filters = fc.get('filters')
+    original = fc.get('original_criteria')
+    
+    st.info("📝 **Manually Added Snapshot**")
+    lines = [
+        f"**Description:** {fc.get('description', 'No description')}",
+        "**Entry Type:** Manual addition",
+        # API retrieval status
+        "✅ **Details retrieved from API**" if fc.get('api_retrieved')
+        else "⚠️ **Basic record created** (API retrieval failed)",
+    ]
+    
+    # Show parsed filters if available
+    if filters:
+        lines.append("**Parsed Filters:**")
+        st.markdown("\n\n".join(lines))
+        st.json(filters)
+        lines = []
+    else:
+        lines.append("**Parsed Filters:** No filter criteria available")
+    
+    # Show original criteria if available
+    if original:
+        lines.append("**Original Filter Criteria:**")
+        st.markdown("\n\n".join(lines))
+        st.code(original, language='json')
+    else:
+        lines.append("**Original Filter Criteria:** Not provided")
+        st.markdown("\n\n".join(lines))
+
+@st.fragment
+def _delete_panel(snapshot_id):
+    """
+    Render the delete button and its confirmation dialog.
+    Runs as a fragment; only a successful delete triggers a full app rerun.
+    """
+    # Delete button with confirmation
+    if st.button("🗑️ Delete Snapshot", type="secondary"):
+        st.session_state['show_delete_confirm'] = True
+
+    # Delete confirmation dialog
+    if st.session_state.get('show_delete_confirm', False):
+        st.warning("⚠️ **Delete Confirmation**")
+        st.write(f"Are you sure you want to delete snapshot `{snapshot_id[:12]}...`?")
+        st.write("This will permanently remove:")
+        st.write("• Snapshot record and metadata")
+        st.write("• Downloaded data (if any)")
+
+        confirm_col1, confirm_col2 = st.columns(2)
+        with confirm_col1:
+            if st.button("✅ Yes, Delete", type="primary"):
+                if delete_snapshot_record(snapshot_id):
+                    st.success("✅ Snapshot deleted successfully!")
+                    # Clear session state and refresh
+                    st.session_state.pop('selected_snapshot_id', None)
+                    st.session_state['show_delete_confirm'] = False
+                    st.rerun()
+                else:
+                    st.error("❌ Failed to delete snapshot")
+
+        with confirm_col2:
+            if st.button("❌ Cancel"):
+                st.session_state['show_delete_confirm'] = False
+                st.rerun(scope="fragment")
+
+@st.fragment(run_every=STATUS_CHECK_INTERVAL)
+def _auto_refresh_panel(records):
+    """
+    Poll pending snapshots every STATUS_CHECK_INTERVAL seconds. Only this fragment
+    reruns on the timer; the full page reruns only when a status changed.
+    """
+    pending = any(_is_pollable(r) for r in records)
+    
+    # Reload the page once the startup check has written new statuses
+    status_thread = st.session_state.get('status_thread')
+    if status_thread is not None and not status_thread[0].is_alive():
+        del st.session_state['status_thread']
+        if status_thread[1].get('updated'):
+            # The worker only reports the count; st caches are cleared here
+            _fetch_metadata_cached.clear()
+            st.rerun()
+    
+    # No API calls or writes when nothing is pending or another tab polled recently
+    if pending and _status_check_due():
+        if poll_snapshot_statuses(records, _global_throttle()):
+            _fetch_metadata_cached.clear()
+            st.rerun()
+    
+    if pending:
+        st.info(f"🔄 Auto-refresh every {STATUS_CHECK_INTERVAL}s")
+    else:
+        st.info("✅ All snapshots final")
+
 def main():
     # Header
     st.markdown('<h1 class="main-header">📊 BrightData Snapshot Viewer</h1>', unsafe_allow_html=True)
@@ -339,115 +1146,70 @@ def main():
         st.info("💡 Use the demo.ipynb notebook to submit filters and create snapshots.")
         return
     
+    # Every refresh path below is skipped outright once all snapshots are terminal
+    has_pending = any(_is_pollable(r) for r in records)
+    
     # Auto-check status for non-completed snapshots (only on first load)
-    if 'status_checked' not in st.session_state:
-        with st.spinner("🔄 Checking snapshot statuses..."):
-            updated_count = 0
-            for record in records:
-                if update_snapshot_status(record):
-                    updated_count += 1
-            
-            if updated_count > 0:
-                st.success(f"✅ Auto-updated {updated_count} snapshot statuses")
-                st.rerun()
-        
-        st.session_state['status_checked'] = True
-    
-    # Auto-refresh mechanism
-    if 'last_refresh' not in st.session_state:
-        st.session_state['last_refresh'] = time.time()
-    
-    # Check if 30 seconds have passed since last refresh
-    current_time = time.time()
-    time_since_refresh = current_time - st.session_state['last_refresh']
-    
-    if time_since_refresh >= 30:
-        # Auto-refresh statuses
-        updated_count = 0
-        for record in records:
-            if update_snapshot_status(record):
-                updated_count += 1
-        
-        if updated_count > 0:
-            st.success(f"🔄 Auto-refresh: Updated {updated_count} snapshot statuses")
-        
-        st.session_state['last_refresh'] = current_time
-        st.rerun()
+    # The check runs in the background; the auto-refresh panel picks up its results
+    if 'status_checked' not in st.session_state and has_pending and _status_check_due():
+        st.session_state['status_thread'] = _start_background_status_check(records)
     
-    # Store countdown info for display
-    st.session_state['countdown_seconds'] = max(0, 30 - int(time_since_refresh))
+    st.session_state['status_checked'] = True
     
     # Sidebar - Snapshot List
     st.sidebar.header("📊 All Snapshots")
     
     # Status summary in sidebar
-    status_counts = {}
-    for record in records:
-        status = record.get('status', 'submitted')  # Default to submitted instead of unknown
-        status_counts[status] = status_counts.get(status, 0) + 1
+    # One pass over the records feeds both the sidebar summary and the metric cards
+    status_counts = Counter(record.get('status', 'submitted') for record in records)  # Default to submitted instead of unknown
     
     # Display status summary
     if status_counts:
         status_text = " | ".join([f"{status}: {count}" for status, count in status_counts.items()])
         st.sidebar.caption(f"Status: {status_text}")
     
-    # Display all snapshots in sidebar
-    for i, record in enumerate(records):
-        status = record.get('status', 'submitted')  # Default to submitted instead of unknown
-        date = record.get('submission_time', 'Unknown date')
-        is_selected = st.session_state.get('selected_snapshot', {}).get('snapshot_id') == record['snapshot_id']
-        
-        if date != 'Unknown date':
-            try:
-                date_obj = datetime.fromisoformat(date.replace('Z', '+00:00'))
-                date_str = date_obj.strftime('%Y-%m-%d %H:%M:%S')
-            except:
-                date_str = date
-        else:
-            date_str = 'Unknown'
-        
-        # Get filter count
-        filter_criteria = record.get('filter_criteria', {})
-        filter_count = 0
-        if filter_criteria:
-            if 'filters' in filter_criteria:
-                filter_count = len(filter_criteria['filters'])
-            else:
-                filter_count = 1
-        
-        # Get records limit
-        records_limit = record.get('records_limit', 'N/A')
-        
-        # Get title (use snapshot ID as fallback)
-        title = record.get('title', f"Snapshot {record['snapshot_id'][:12]}...")
-        
-        # Create clickable card for each snapshot in sidebar
-        card_style = ""
-        if is_selected:
-            card_style = "background-color: #e3f2fd; border-left: 3px solid #2196f3;"
-        
-        # Create a clickable container for each snapshot
-        with st.sidebar.container():
-            # Status badge with icon
-            status_icons = {
-                'completed': '✅',
-                'ready': '✅', 
-                'processing': '⏳',
-                'building': '🔨',
-                'submitted': '📤',
-                'failed': '❌'
-            }
-            icon = status_icons.get(status, '📋')
-            
-            # Create clickable area with title
-            if st.sidebar.button(
-                f"{icon} {status.upper()}\n{title}\n[{records_limit} Records] {filter_count} filters\n{date_str}",
-                key=f"select_{i}",
-                help="Click to select this snapshot",
-                use_container_width=True
-            ):
-                st.session_state['selected_snapshot'] = record
-                st.rerun()
+    # Only the current page of snapshots is sent to the sidebar
+    page_count = max(1, -(-len(records) // SIDEBAR_PAGE_SIZE))
+    page = 1
+    if page_count > 1:
+        # Keep a remembered page in range after snapshots are deleted
+        if st.session_state.get('sidebar_page', 1) > page_count:
+            st.session_state['sidebar_page'] = page_count
+        page = st.sidebar.number_input(
+            "Page", min_value=1, max_value=page_count, step=1,
+            help=f"{len(records)} snapshots, {SIDEBAR_PAGE_SIZE} per page",
+            key="sidebar_page"
+        )
+    page_start = (page - 1) * SIDEBAR_PAGE_SIZE
+    page_records = records[page_start:page_start + SIDEBAR_PAGE_SIZE]
+    
+    # One selectable table per page instead of a container and button per snapshot
+    snapshot_table = pd.DataFrame({
+        'Status': [
+            f"{STATUS_ICONS.get(status, DEFAULT_STATUS_CONFIG['icon'])} {status.upper()}"
+            for status in (r.get('status', 'submitted') for r in page_records)  # Default to submitted instead of unknown
+        ],
+        'Title': [r['_title'] for r in page_records],
+        'Records': [r['_records_limit_str'] for r in page_records],
+        'Filters': [r['_filter_count'] for r in page_records],
+        'Submitted': [r['_date_str'] for r in page_records],
+    })
+    table_event = st.sidebar.dataframe(
+        snapshot_table,
+        hide_index=True,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key=f"snapshot_table_{page}"
+    )
+    
+    # Only act on a new pick, so a row shift after a refresh doesn't change the selection
+    selected_rows = table_event.selection.rows
+    if selected_rows and selected_rows[0] < len(page_records):
+        table_pick = (page, selected_rows[0])
+        if st.session_state.get('_table_pick') != table_pick:
+            st.session_state['_table_pick'] = table_pick
+            st.session_state['selected_snapshot_id'] = page_records[selected_rows[0]]['snapshot_id']
     
     # Main content area controls
     col1, col2 = st.columns([3, 1])
@@ -460,30 +1222,24 @@ def main():
         
         with col2_1:
             if st.button("🔄 Refresh", help="Check status of all non-completed snapshots"):
-                with st.spinner("Checking snapshot statuses..."):
-                    updated_count = 0
-                    for record in records:
-                        if update_snapshot_status(record):
-                            updated_count += 1
-                    
-                    if updated_count > 0:
-                        st.success(f"✅ Updated {updated_count} snapshot statuses")
-                        st.rerun()
-                    else:
-                        st.info("ℹ️ No status updates needed")
+                if not has_pending:
+                    st.info("ℹ️ No pending snapshots to check")
+                else:
+                    with st.spinner("Checking snapshot statuses..."):
+                        updated_count = poll_snapshot_statuses(records, _global_throttle())
+                        
+                        if updated_count is None:
+                            st.info("ℹ️ A status check is already running")
+                        elif updated_count > 0:
+                            _fetch_metadata_cached.clear()
+                            st.success(f"✅ Updated {updated_count} snapshot statuses")
+                            st.rerun()
+                        else:
+                            st.info("ℹ️ No status updates needed")
         
         with col2_2:
-            # Show auto-refresh status with countdown
-            countdown_seconds = st.session_state.get('countdown_seconds', 0)
-            
-            if countdown_seconds > 0:
-                st.info(f"🔄 Next refresh: {countdown_seconds}s")
-            else:
-                st.info("🔄 Ready to refresh")
-                # Auto-refresh when countdown reaches 0
-                if st.button("🔄 Auto Refresh", help="Check status of all snapshots"):
-                    st.session_state['last_refresh'] = current_time
-                    st.rerun()
+            # Polls on its own timer; the rest of the page only reruns on a status change
+            _auto_refresh_panel(records)
     
     # Main content area
     # Check if we have any records
@@ -492,12 +1248,11 @@ def main():
         st.info("💡 Make sure you have run some queries to generate snapshots.")
         return
     
-    # Get selected record (from session state or first record)
-    if 'selected_snapshot' in st.session_state:
-        selected_record = st.session_state['selected_snapshot']
-    else:
-        selected_record = records[0]
-        st.session_state['selected_snapshot'] = selected_record
+    # Get selected record (from session state or first record). Only the ID is kept
+    # in session state, so the details always reflect the freshly loaded record.
+    selected_id = st.session_state.get('selected_snapshot_id')
+    selected_record = next((r for r in records if r['snapshot_id'] == selected_id), records[0])
+    st.session_state['selected_snapshot_id'] = selected_record['snapshot_id']
     
     # Safety check for selected_record
     if not selected_record:
@@ -513,15 +1268,15 @@ def main():
         st.metric("📊 Total Snapshots", len(records))
     
     with col2:
-        completed_count = sum(1 for r in records if r.get('status', 'submitted') in ['completed', 'ready'])
+        completed_count = status_counts['completed'] + status_counts['ready']
         st.metric("✅ Completed", completed_count)
     
     with col3:
-        processing_count = sum(1 for r in records if r.get('status', 'submitted') in ['submitted', 'processing', 'building'])
+        processing_count = status_counts['submitted'] + status_counts['processing'] + status_counts['building']
         st.metric("⏳ Processing", processing_count)
     
     with col4:
-        failed_count = sum(1 for r in records if r.get('status', 'submitted') == 'failed')
+        failed_count = status_counts['failed']
         st.metric("❌ Failed", failed_count)
     
     st.divider()
@@ -564,8 +1319,7 @@ def main():
                 
                 # Save back to file
                 record_file = Path("snapshot_records") / f"{snapshot_id}.json"
-                with open(record_file, 'w') as f:
-                    json.dump(selected_record, f, indent=2)
+                _dump_record(record_file, selected_record)
                 
                 st.success("✅ Metadata updated automatically!")
                 st.rerun()
@@ -605,267 +1359,90 @@ def main():
         st.subheader("🛠️ Actions")
         
         # Check if data is available (support multiple formats)
-        downloads_dir = Path("data/downloads")
-        data_file = None
-        data_available = False
-        
-        # Check for different file formats
-        for ext in ['.json', '.csv', '.json.gz', '.csv.gz']:
-            potential_file = downloads_dir / f"{snapshot_id}{ext}"
-            if potential_file.exists():
-                data_file = potential_file
-                data_available = True
-                break
+        data_signature = find_snapshot_data_file(snapshot_id)
+        data_available = data_signature is not None
         
         if data_available:
             st.success("✅ Data available for analysis")
         else:
             st.warning("⚠️ Data not downloaded yet")
             
-            # Download form with snapshot ID requirement
-            with st.form(f"download_form_{snapshot_id}"):
-                st.write("**📥 Download Snapshot Data**")
-                st.write("⚠️ **Important**: Downloading data incurs costs. Only download when needed.")
-                
-                
-                # Pre-fill with current snapshot ID
-                download_snapshot_id = st.text_input(
-                    "Snapshot ID to Download",
-                    value=snapshot_id,
-                    help="Enter the snapshot ID you want to download. This will incur costs.",
-                    disabled=True  # Pre-filled and disabled to prevent mistakes
-                )
-                
-                # Download options
-                download_format = st.selectbox(
-                    "Download Format",
-                    options=["json", "csv"],
-                    index=0,
-                    help="Choose the format for downloaded data"
-                )
-                
-                compress_data = st.checkbox(
-                    "Compress Download",
-                    value=False,
-                    help="Compress the downloaded file to reduce size"
-                )
-                
-                col_download1, col_download2 = st.columns(2)
-                with col_download1:
-                    download_submitted = st.form_submit_button(
-                        "📥 Download Data",
-                        type="primary",
-                        help="This will download the snapshot data and may incur costs"
-                    )
-                
-                with col_download2:
-                    if st.form_submit_button("❌ Cancel"):
-                        st.rerun()
-                
-                # Handle download
-                if download_submitted:
-                    if not download_snapshot_id or not download_snapshot_id.strip():
-                        st.error("❌ Snapshot ID is required for download")
-                        st.info("💡 Please provide a valid snapshot ID to proceed")
-                        return
-                    
-                    # Additional validation
-                    if not download_snapshot_id.startswith('snap_'):
-                        st.error("❌ Invalid snapshot ID format")
-                        st.info("💡 Snapshot ID should start with 'snap_'")
-                        return
-                    
-                    try:
-                        # Initialize BrightData filter
-                        dataset_id = selected_record.get('dataset_id')
-                        if not dataset_id:
-                            st.error("❌ No dataset ID found in record")
-                            return
-                        
-                        brightdata = BrightDataFilter(dataset_id)
-                        
-                        # Show download progress
-                        with st.spinner(f"Downloading {download_snapshot_id} in {download_format.upper()} format..."):
-                            # Download the snapshot content
-                            response = brightdata.download_snapshot_content(
-                                download_snapshot_id,
-                                format=download_format,
-                                compress=compress_data
-                            )
-                            
-                            if response.status_code == 200:
-                                # Check if the response contains actual data or a status message
-                                content = response.text.strip()
-                                
-                                # Check for status messages
-                                if content in ["Snapshot is building. Try again in a few minutes", 
-                                              "Snapshot not ready", 
-                                              "Snapshot is processing",
-                                              "No data available"]:
-                                    st.warning(f"⚠️ {content}")
-                                    st.info("💡 The snapshot is still being processed. Please wait and try again later.")
-                                    return
-                                
-                                # Save the downloaded data
-                                downloads_dir = Path("data/downloads")
-                                downloads_dir.mkdir(exist_ok=True)
-                                
-                                file_extension = f".{download_format}"
-                                if compress_data:
-                                    file_extension += ".gz"
-                                
-                                file_path = downloads_dir / f"{download_snapshot_id}{file_extension}"
-                                
-                                with open(file_path, 'wb') as f:
-                                    f.write(response.content)
-                                
-                                # Update the record to mark as downloaded
-                                record_file = Path("snapshot_records") / f"{download_snapshot_id}.json"
-                                if record_file.exists():
-                                    with open(record_file, 'r') as f:
-                                        record = json.load(f)
-                                    
-                                    record['downloaded'] = True
-                                    record['download_time'] = datetime.now().isoformat()
-                                    record['download_format'] = download_format
-                                    record['download_file'] = str(file_path)
-                                    
-                                    with open(record_file, 'w') as f:
-                                        json.dump(record, f, indent=2)
-                                
-                                st.success(f"✅ Successfully downloaded {download_snapshot_id}!")
-                                st.info(f"📁 File saved to: `{file_path}`")
-                                st.info(f"📊 Size: {len(response.content) / 1024 / 1024:.2f} MB")
-                                
-                                # Refresh the page to show updated status
-                                st.rerun()
-                                
-                            else:
-                                st.error(f"❌ Download failed: HTTP {response.status_code}")
-                                if response.text:
-                                    st.error(f"Error details: {response.text}")
-                                    
-                    except Exception as e:
-                        st.error(f"❌ Download error: {str(e)}")
-                        st.info("💡 Make sure the snapshot is ready and you have sufficient credits")
+            _download_panel(selected_record)
     
     with col2:
-        # Filter Criteria
-        st.subheader("🔍 Filter Criteria")
-        filter_criteria = selected_record.get('filter_criteria', {})
-        if filter_criteria:
-            # Check if it's a manual entry
-            if filter_criteria.get('manual_entry'):
-                st.info("📝 **Manually Added Snapshot**")
-                st.write(f"**Description:** {filter_criteria.get('description', 'No description')}")
-                st.write(f"**Entry Type:** Manual addition")
-                
-                # Show API retrieval status
-                if filter_criteria.get('api_retrieved'):
-                    st.success("✅ **Details retrieved from API**")
-                else:
-                    st.warning("⚠️ **Basic record created** (API retrieval failed)")
-                
-                # Show parsed filters if available
-                if filter_criteria.get('filters'):
-                    st.write("**Parsed Filters:**")
-                    st.json(filter_criteria['filters'])
-                else:
-                    st.write("**Parsed Filters:** No filter criteria available")
-                
-                # Show original criteria if available
-                if filter_criteria.get('original_criteria'):
-                    st.write("**Original Filter Criteria:**")
-                    st.code(filter_criteria['original_criteria'], language='json')
-                else:
-                    st.write("**Original Filter Criteria:** Not provided")
-            else:
-                # Show description if available
-                description = selected_record.get('description')
-                if description:
-                    st.write(f"**Description:** {description}")
-                    st.divider()
-                st.json(filter_criteria)
-        else:
-            st.info("No filter criteria available")
+        _filter_criteria_panel(selected_record)
     
     with col2:
-        # Delete button with confirmation
-        if st.button("🗑️ Delete Snapshot", type="secondary"):
-            st.session_state['show_delete_confirm'] = True
-        
-        # Delete confirmation dialog
-        if st.session_state.get('show_delete_confirm', False):
-            st.warning("⚠️ **Delete Confirmation**")
-            st.write(f"Are you sure you want to delete snapshot `{snapshot_id[:12]}...`?")
-            st.write("This will permanently remove:")
-            st.write("• Snapshot record and metadata")
-            st.write("• Downloaded data (if any)")
-            
-            confirm_col1, confirm_col2 = st.columns(2)
-            with confirm_col1:
-                if st.button("✅ Yes, Delete", type="primary"):
-                    if delete_snapshot_record(snapshot_id):
-                        st.success("✅ Snapshot deleted successfully!")
-                        # Clear session state and refresh
-                        if 'selected_snapshot' in st.session_state:
-                            del st.session_state['selected_snapshot']
-                        st.session_state['show_delete_confirm'] = False
-                        st.rerun()
-                    else:
-                        st.error("❌ Failed to delete snapshot")
-            
-            with confirm_col2:
-                if st.button("❌ Cancel"):
-                    st.session_state['show_delete_confirm'] = False
-                    st.rerun()
+        _delete_panel(snapshot_id)
     
     # Data Analysis (if data is available)
     if data_available:
         st.divider()
         st.header("📈 Data Analysis")
         
+        # Show a cheap preview first; the full file is only parsed on request
+        preview_rows = st.number_input(
+            "Preview rows", min_value=1, max_value=PREVIEW_MAX_ROWS, value=10, step=10,
+            key="preview_rows"
+        )
+        preview_df = _load_head_cached(data_signature, int(preview_rows))
+        if preview_df is not None:
+            st.subheader("🔍 Data Preview")
+            st.dataframe(preview_df, use_container_width=True)
+        
+        analysis_key = f"full_analysis_{snapshot_id}"
+        if not st.session_state.get(analysis_key):
+            if st.button("📊 Run full analysis", help="Load the complete snapshot for statistics and charts"):
+                st.session_state[analysis_key] = True
+        
         # Load and display data
-        df = load_snapshot_data(snapshot_id)
+        df = _load_data_cached(data_signature) if st.session_state.get(analysis_key) else None
         if df is not None:
+            n = len(df)
+            
+            df_signature = (data_signature, df.shape, tuple(df.columns))
+            dtypes = df.dtypes
+            dtype_names = tuple(dtypes.astype(str))
+            numeric_cols, categorical_cols = _classify_columns(df_signature, dtype_names, dtypes)
+            
             # Basic info
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("📊 Records", len(df))
+                st.metric("📊 Records", n)
             with col2:
                 st.metric("📋 Columns", len(df.columns))
             with col3:
-                st.metric("💾 Memory", f"{df.memory_usage(deep=True).sum() / 1024 / 1024:.1f} MB")
-            
-            # Data preview
-            st.subheader("🔍 Data Preview")
-            st.dataframe(df.head(10), use_container_width=True)
+                # The shallow figure counts object columns as pointers only
+                exact_memory = st.checkbox("Exact memory usage", help="Measure every string; slow on large snapshots")
+                memory_mb = _memory_usage_mb(df_signature, df, deep=exact_memory)
+                st.metric("💾 Memory" if exact_memory else "💾 Memory (approx.)", f"{memory_mb:.1f} MB")
             
-            # Column information
-            st.subheader("📋 Column Information")
-            st.dataframe(pd.DataFrame({
-                'Column': df.columns,
-                'Type': df.dtypes,
-                'Non-Null Count': df.count(),
-                'Null Count': df.isnull().sum(),
-                'Null %': (df.isnull().sum() / len(df) * 100).round(2)
-            }), use_container_width=True)
+            # Each section below is only computed once it is switched on
+            if st.toggle("📋 Column Information", key="show_column_info"):
+                st.dataframe(_column_info(df_signature, dtype_names, df), use_container_width=True, hide_index=True, column_config={
+                    # Formatting happens client-side instead of rounding in Python
+                    'Non-Null Count': st.column_config.NumberColumn(format='%d'),
+                    'Null Count': st.column_config.NumberColumn(format='%d'),
+                    'Null %': st.column_config.NumberColumn(format='%.2f%%'),
+                })
             
-            # Statistical analysis
-            numeric_cols = df.select_dtypes(include=['number']).columns
             if len(numeric_cols) > 0:
-                st.subheader("📊 Statistical Summary")
-                st.dataframe(df[numeric_cols].describe(), use_container_width=True)
+                # Statistical analysis
+                if st.toggle("📊 Statistical Summary", key="show_describe"):
+                    st.dataframe(_describe(df_signature, df, numeric_cols), use_container_width=True, column_config={
+                        col: st.column_config.NumberColumn(format='%.2f') for col in numeric_cols
+                    })
                 
                 # Simple visualizations
-                if len(numeric_cols) > 0:
-                    st.subheader("📈 Visualizations")
+                if st.toggle("📈 Visualizations", key="show_charts"):
+                    # Plotly is only imported once a chart section is opened
+                    import plotly.express as px
                     
                     # Select columns for visualization
                     selected_cols = st.multiselect(
                         "Select numeric columns to visualize:",
-                        options=numeric_cols.tolist(),
-                        default=numeric_cols.tolist()[:2] if len(numeric_cols) >= 2 else numeric_cols.tolist()
+                        options=numeric_cols,
+                        default=numeric_cols[:2]
                     )
                     
                     if selected_cols:
@@ -874,34 +1451,46 @@ def main():
                         with col1:
                             # Histogram
                             if len(selected_cols) >= 1:
-                                fig_hist = px.histogram(df, x=selected_cols[0], title=f"Distribution of {selected_cols[0]}")
+                                # Bin counts are computed here, so only the bars reach the browser
+                                hist = _histogram_bins(df_signature, df, selected_cols[0])
+                                fig_hist = px.bar(hist, x=selected_cols[0], y='count',
+                                                  title=f"Distribution of {selected_cols[0]}")
+                                fig_hist.update_traces(width=hist['width'])
+                                fig_hist.update_layout(bargap=0)
                                 st.plotly_chart(fig_hist, use_container_width=True)
                         
                         with col2:
                             # Scatter plot
                             if len(selected_cols) >= 2:
-                                fig_scatter = px.scatter(df, x=selected_cols[0], y=selected_cols[1], 
-                                                       title=f"{selected_cols[0]} vs {selected_cols[1]}")
-                                st.plotly_chart(fig_scatter, use_container_width=True)
+                                # Plot a capped sample; WebGL keeps it responsive where SVG stalls
+                                scatter_df = _chart_sample(df_signature, df, selected_cols[:2])
+                                title = f"{selected_cols[0]} vs {selected_cols[1]}"
+                                if len(scatter_df) < n:
+                                    title += f" (sample of {len(scatter_df):,} rows)"
+                                fig_scatter = px.scatter(scatter_df, x=selected_cols[0], y=selected_cols[1], 
+                                                       title=title,
+                                                       render_mode="webgl")
+                                st.plotly_chart(fig_scatter, use_container_width=True, config={'scrollZoom': True})
             
             # Categorical analysis
-            categorical_cols = df.select_dtypes(include=['object']).columns
-            if len(categorical_cols) > 0:
-                st.subheader("📋 Categorical Analysis")
+            if len(categorical_cols) > 0 and st.toggle("📋 Categorical Analysis", key="show_categorical"):
+                import plotly.express as px
                 
                 selected_cat_col = st.selectbox(
                     "Select categorical column:",
-                    options=categorical_cols.tolist()
+                    options=categorical_cols
                 )
                 
                 if selected_cat_col:
-                    value_counts = df[selected_cat_col].value_counts().head(10)
+                    value_counts = top_values(data_signature, selected_cat_col)
                     
                     col1, col2 = st.columns(2)
                     
                     with col1:
                         st.write("**Top 10 Values:**")
-                        st.dataframe(value_counts.to_frame('Count'), use_container_width=True)
+                        st.dataframe(value_counts.to_frame('Count'), use_container_width=True, column_config={
+                            'Count': st.column_config.NumberColumn(format='%d'),
+                        })
                     
                     with col2:
                         fig_bar = px.bar(x=value_counts.index, y=value_counts.values,
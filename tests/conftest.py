@@ -0,0 +1,98 @@
+"""
+Shared pytest fixtures.
+
+BrightData API calls are answered by a fake transport adapter mounted on the
+filter's HTTP session, so tests run offline and without API quota. Tests
+marked `integration` talk to the live API; run them with `pytest -m integration`.
+"""
+
+import itertools
+import json
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+BRIGHTDATA_API_PREFIX = "https://api.brightdata.com/"
+
+
+class FakeBrightDataAdapter(BaseAdapter):
+    """Answers BrightData API requests with canned JSON and records them"""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+        self._snapshot_numbers = itertools.count(1)
+        # snapshot_id -> metadata updates returned by successive status checks;
+        # the last one repeats. Snapshots not listed are immediately ready.
+        self.snapshot_metadata = {}
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        path = request.path_url.split("?", 1)[0]
+
+        if request.method == "POST" and path == "/datasets/filter":
+            status, body = 200, {"snapshot_id": f"snap_test{next(self._snapshot_numbers):04d}"}
+        elif request.method == "GET" and path.startswith("/datasets/snapshots/"):
+            snapshot_id = path[len("/datasets/snapshots/"):].split("/", 1)[0]
+            status, body = 200, {"id": snapshot_id, "status": "ready", "dataset_size": 0}
+            updates = self.snapshot_metadata.get(snapshot_id)
+            if updates:
+                body.update(updates.pop(0) if len(updates) > 1 else updates[0])
+        else:
+            status, body = 404, {"error": f"Unexpected request: {request.method} {path}"}
+
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode()
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_api():
+    """Fake BrightData transport; tests can script snapshot metadata on it"""
+    return FakeBrightDataAdapter()
+
+
+@pytest.fixture
+def brightdata(tmp_path, fake_api):
+    """BrightDataFilter on the fake transport, keeping records in a temporary directory"""
+    from util.brightdata import BrightDataFilter
+
+    brightdata_filter = BrightDataFilter(storage_dir=str(tmp_path / "snapshot_records"), api_key="test-api-key")
+    brightdata_filter._session.mount(BRIGHTDATA_API_PREFIX, fake_api)
+    yield brightdata_filter
+    brightdata_filter.close()
+
+
+@pytest.fixture(scope="module")
+def offline_strategy_queries(tmp_path_factory):
+    """
+    WalmartStrategyQueries wired to the fake BrightData transport.
+
+    Runs in a temporary directory so local snapshot records don't touch the
+    real snapshot_records folder, and uses a dummy API key.
+    """
+    from util.brightdata import BrightDataFilter
+    from walmart_strategy_queries import WalmartStrategyQueries
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp("brightdata"))
+        mp.setattr("util.config.get_brightdata_api_key", lambda: "test-api-key")
+        # Don't let earlier (or later) runs in this process share cached submissions
+        BrightDataFilter.search_data_cached.cache_clear()
+
+        strategy_queries = WalmartStrategyQueries()
+        assert strategy_queries.brightdata_filter, "Could not initialize BrightData filter"
+        strategy_queries.brightdata_filter._session.mount(BRIGHTDATA_API_PREFIX, FakeBrightDataAdapter())
+
+        yield strategy_queries
+
+        BrightDataFilter.search_data_cached.cache_clear()
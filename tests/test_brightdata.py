@@ -0,0 +1,386 @@
+"""
+Tests for BrightDataFilter snapshot handling against the fake BrightData
+transport (see conftest.py).
+"""
+
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+import util.brightdata
+from util.brightdata import RECORD_INDEX_FILE, BrightDataFilter, _dump_json_file, _json_bytes, _parse_response
+
+
+def submit(brightdata, rating):
+    """Submit a simple filter and return its snapshot ID"""
+    return brightdata.search_data(brightdata.filter.rating > rating, records_limit=10)["snapshot_id"]
+
+
+def test_wait_for_many_returns_final_metadata(brightdata):
+    """Every snapshot is polled to completion and its record marked ready"""
+    snapshot_ids = [submit(brightdata, 3), submit(brightdata, 4)]
+
+    # Duplicate IDs are only polled once
+    results = brightdata.wait_for_many(snapshot_ids + snapshot_ids[:1], max_wait_time=5)
+
+    assert list(results) == snapshot_ids
+    for snapshot_id in snapshot_ids:
+        assert results[snapshot_id]["status"] == "ready"
+        record = brightdata.get_snapshot_record(snapshot_id)
+        assert record["status"] == "ready"
+        assert record["completion_time"]
+
+
+def test_wait_for_many_polls_until_ready(brightdata, fake_api):
+    """Snapshots still building are checked again until they finish"""
+    snapshot_id = submit(brightdata, 4)
+    fake_api.snapshot_metadata[snapshot_id] = [{"status": "scheduled"}, {"status": "building"}, {"status": "ready"}]
+
+    results = asyncio.run(brightdata.wait_for_many_async([snapshot_id], max_wait_time=30, check_interval=0.01))
+
+    assert results[snapshot_id]["status"] == "ready"
+    assert brightdata.get_snapshot_record(snapshot_id)["status"] == "ready"
+
+
+def test_wait_for_many_flushes_last_metadata_on_timeout(brightdata, fake_api):
+    """On timeout the last status check is written to the record, even without a status change"""
+    snapshot_id = submit(brightdata, 4)
+    fake_api.snapshot_metadata[snapshot_id] = [
+        {"status": "building", "progress": 1},
+        {"status": "building", "progress": 2},
+    ]
+
+    results = brightdata.wait_for_many([snapshot_id], max_wait_time=0.05)
+
+    assert results[snapshot_id] == {"id": snapshot_id, "status": "building", "dataset_size": 0, "progress": 2}
+    record = brightdata.get_snapshot_record(snapshot_id)
+    assert record["status"] == "building"
+    assert record["metadata"]["progress"] == 2
+
+
+def test_wait_for_many_returns_status_errors(brightdata):
+    """A snapshot whose status check keeps failing comes back as the exception"""
+    brightdata.base_url = "https://api.brightdata.com/datasets/missing"
+
+    results = brightdata.wait_for_many(["snap_unknown"], max_wait_time=0.05)
+
+    assert isinstance(results["snap_unknown"], Exception)
+    assert "HTTP 404" in str(results["snap_unknown"])
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_parse_response_wraps_invalid_json(monkeypatch, use_orjson):
+    """A successful response with a non-JSON body raises the usual failure exception"""
+    if not use_orjson:
+        monkeypatch.setattr(util.brightdata, "orjson", None)
+    elif util.brightdata.orjson is None:
+        pytest.skip("orjson not installed")
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"<html>gateway hiccup</html>"
+
+    with pytest.raises(Exception, match=r"^API request failed: invalid JSON body \(HTTP 200\)"):
+        _parse_response(response, "API request failed")
+
+
+@pytest.mark.skipif(util.brightdata.orjson is None, reason="orjson not installed")
+@pytest.mark.parametrize("pretty", [False, True])
+def test_dump_json_file_bytes_match_with_and_without_orjson(tmp_path, monkeypatch, pretty):
+    """Non-ASCII records are written as the same UTF-8 bytes whether or not orjson is used"""
+    record = {"title": "Wasserkocher – Edelstahl 😀", "filter_criteria": {"name": "rating", "value": "4"}}
+    _dump_json_file(tmp_path / "orjson.json", record, pretty=pretty)
+    with monkeypatch.context() as mp:
+        mp.setattr(util.brightdata, "orjson", None)
+        _dump_json_file(tmp_path / "stdlib.json", record, pretty=pretty)
+        assert util.brightdata._load_json_file(tmp_path / "stdlib.json") == record
+
+    assert (tmp_path / "stdlib.json").read_bytes() == (tmp_path / "orjson.json").read_bytes()
+    if not pretty:
+        assert (tmp_path / "stdlib.json").read_bytes() == _json_bytes(record)
+
+
+@pytest.mark.parametrize("attempt", range(12))
+def test_poll_delay_backs_off_with_jitter(attempt):
+    """Delays grow 1.5x from 2s, within ±20% jitter, capped at check_interval"""
+    base = min(30, 2 * 1.5 ** attempt)
+    delay = BrightDataFilter._poll_delay(attempt, check_interval=30, remaining=3600)
+    assert base * 0.8 <= delay <= base * 1.2
+
+
+def test_poll_delay_clamped_to_remaining_time():
+    """The delay never runs past the wait deadline and is never negative"""
+    assert BrightDataFilter._poll_delay(10, check_interval=30, remaining=1.5) == 1.5
+    assert BrightDataFilter._poll_delay(0, check_interval=30, remaining=-5) == 0.0
+
+
+def test_filter_call_matches_field_call(brightdata):
+    """bd.filter(field, op, value) and bd.filter.field(op, value) build the same condition"""
+    assert brightdata.filter("rating", ">=", "4.5") == brightdata.filter.rating(">=", "4.5")
+    for build in (lambda: brightdata.filter("rating", "~", 1), lambda: brightdata.filter.rating("~", 1)):
+        with pytest.raises(ValueError, match="Unknown operator: ~"):
+            build()
+
+
+@pytest.mark.parametrize("name, operator, message", [
+    ("no_such_field", "=", "Field 'no_such_field' not found"),
+    ("rating", "includes", "Operator 'includes' not supported for field 'rating'"),
+])
+def test_create_filter_rejects_invalid_pairs(brightdata, name, operator, message):
+    """Unknown fields and unsupported operators raise a descriptive ValueError"""
+    with pytest.raises(ValueError, match=message):
+        brightdata.create_filter(name, operator, "x")
+    # Skipping validation defers the check to submission time
+    assert brightdata.create_filter(name, operator, "x", validate=False).name == name
+
+
+def test_search_data_validates_tree_on_request(brightdata, fake_api):
+    """search_data(validate=True) rejects an invalid tree before any request is sent"""
+    invalid = (brightdata.filter.rating > 4) | brightdata.create_filter("rating", "includes", "x", validate=False)
+
+    with pytest.raises(ValueError, match="Operator 'includes' not supported for field 'rating'"):
+        brightdata.search_data(invalid, records_limit=10, validate=True)
+    assert fake_api.requests == []
+
+    # Without validate the filter goes to the API unchanged, as before
+    assert brightdata.search_data(invalid, records_limit=10)["snapshot_id"]
+    assert len(fake_api.requests) == 1
+
+
+def test_validate_tree_accepts_valid_nested_filters(brightdata, fake_api):
+    """Valid nested trees pass validation and are submitted"""
+    F = brightdata.filter
+    valid = (F.rating >= 4) & ((F.reviews_count > 100) | F.title.includes("kettle"))
+
+    brightdata.validate_tree(valid)
+    assert brightdata.search_data(valid, records_limit=10, validate=True)["snapshot_id"]
+    assert len(fake_api.requests) == 1
+
+
+def test_filters_equal_flattens_nested_groups(brightdata):
+    """A record saved with nested OR groups matches the flat dict built for the same chain"""
+    F = brightdata.filter
+    flat = ((F.rating > 4) | (F.reviews_count > 100) | F.title.includes("kettle")).to_dict()
+    assert len(flat["filters"]) == 3
+
+    nested = {"operator": "or", "filters": [
+        {"operator": "or", "filters": [
+            {"name": "title", "operator": "includes", "value": "kettle"},
+            {"name": "rating", "operator": ">", "value": "4"},
+        ]},
+        {"name": "reviews_count", "operator": ">", "value": "100"},
+    ]}
+    assert brightdata._filters_equal(flat, nested)
+    # Groups with a different operator are not spliced in
+    assert not brightdata._filters_equal(flat, dict(nested, filters=[dict(nested["filters"][0], operator="and"),
+                                                                    nested["filters"][1]]))
+
+
+def test_search_data_reuses_record_with_nested_or(brightdata, fake_api):
+    """Resubmitting a query saved before OR chains were flattened reuses its snapshot"""
+    F = brightdata.filter
+    query = (F.rating > 4) | (F.reviews_count > 100) | F.title.includes("kettle")
+    snapshot_id = brightdata.search_data(query, records_limit=10)["snapshot_id"]
+
+    # Rewrite the stored filter the way the nested-OR builder used to save it
+    path = record_path(brightdata, snapshot_id)
+    with open(path) as f:
+        record = json.load(f)
+    first, *rest = record["filter_criteria"]["filters"]
+    record["filter_criteria"]["filters"] = [first, {"operator": "or", "filters": rest}]
+    with open(path, "w") as f:
+        json.dump(record, f)
+
+    result = brightdata.search_data(query, records_limit=10)
+    assert result["existing"] and result["snapshot_id"] == snapshot_id
+    assert len(fake_api.requests) == 1
+
+
+def test_to_dict_returns_independent_copies(brightdata, fake_api):
+    """Modifying a to_dict() result doesn't change the filter or its submitted payload"""
+    F = brightdata.filter
+    query = (F.rating > 4) & brightdata.filter("categories", "in", ["Kitchen"])
+    expected = json.loads(json.dumps(query.to_dict()))
+
+    changed = query.to_dict()
+    changed["filters"].append({"name": "title", "operator": "=", "value": "x"})
+    changed["filters"][1]["value"].append("Garden")
+
+    assert query.to_dict() == expected
+    brightdata.search_data(query, records_limit=10)
+    assert json.loads(fake_api.requests[0].body)["filter"] == expected
+
+
+@pytest.fixture
+def clean_search_cache():
+    """Empty the process-wide search_data_cached cache around a test"""
+    BrightDataFilter.search_data_cached.cache_clear()
+    yield
+    BrightDataFilter.search_data_cached.cache_clear()
+
+
+def test_search_data_cached_returns_copies(brightdata, fake_api, clean_search_cache):
+    """Cache hits skip the API and can't be corrupted by a caller modifying its result"""
+    first = brightdata.search_data_cached(brightdata.filter.rating > 4, records_limit=10)
+    first["snapshot_id"] = "modified"
+
+    second = brightdata.search_data_cached(brightdata.filter.rating > 4, records_limit=10)
+    assert second["snapshot_id"] == "snap_test0001"
+    assert len(fake_api.requests) == 1
+
+
+def test_search_data_cached_separates_api_keys(brightdata, fake_api, clean_search_cache):
+    """Filters using different API keys don't share cached submissions"""
+    other = BrightDataFilter(storage_dir=brightdata.storage_dir, api_key="other-api-key")
+    other._session.mount("https://api.brightdata.com/", fake_api)
+    # Both share the storage directory; skip the local-record lookup so only the cache could match
+    other._find_existing_snapshot = lambda filter_obj, records_limit: None
+    brightdata.search_data_cached(brightdata.filter.rating > 4, records_limit=10)
+    with other:
+        other.search_data_cached(other.filter.rating > 4, records_limit=10)
+
+    posts = [request for request in fake_api.requests if request.method == "POST"]
+    assert [request.headers["Authorization"] for request in posts] == [
+        "Bearer test-api-key", "Bearer other-api-key"]
+
+
+def test_search_data_cached_submits_concurrent_duplicates_once(brightdata, monkeypatch, clean_search_cache):
+    """Identical submissions racing each other result in a single search_data call"""
+    submit = brightdata.search_data
+    calls = []
+
+    def slow_search_data(*args, **kwargs):
+        calls.append(args)
+        time.sleep(0.05)  # Keep the first submission in flight while the others arrive
+        return submit(*args, **kwargs)
+
+    monkeypatch.setattr(brightdata, "search_data", slow_search_data)
+    query = brightdata.filter.rating > 4
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(brightdata.search_data_cached, query, 10) for _ in range(4)]
+    results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert {result["snapshot_id"] for result in results} == {"snap_test0001"}
+
+
+def test_search_data_cached_keys_on_title_and_description(brightdata, fake_api, clean_search_cache):
+    """A call with a different title isn't answered from the cached entry of another title"""
+    brightdata.search_data_cached(brightdata.filter.rating > 4, records_limit=10, title="First")
+    brightdata.search_data_cached(brightdata.filter.rating > 4, records_limit=10, title="First")
+    assert len(brightdata.search_data_cached.cache) == 1
+
+    # Not served from the cache: search_data runs and finds the saved record
+    result = brightdata.search_data_cached(brightdata.filter.rating > 4, records_limit=10, title="Second")
+    assert result["existing"] is True
+    assert len(brightdata.search_data_cached.cache) == 2
+    assert len(fake_api.requests) == 1
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_search_data_batch_submits_identical_filters_once(brightdata, fake_api, clean_search_cache, cached):
+    """Identical filters in one batch are submitted once and each position gets its own result"""
+    F = brightdata.filter
+    queries = [
+        {"filter_obj": F.rating > 4, "records_limit": 10},
+        {"filter_obj": F.rating > 3, "records_limit": 10},
+        {"filter_obj": F.rating > 4, "records_limit": 10, "title": "Same filter"},
+        {"filter_obj": F.rating > 4, "records_limit": 20},
+    ]
+
+    results = brightdata.search_data_batch(queries, cached=cached)
+
+    assert len([request for request in fake_api.requests if request.method == "POST"]) == 3
+    assert results[0] == results[2] and results[0] is not results[2]
+    assert len({results[i]["snapshot_id"] for i in (0, 1, 3)}) == 3
+
+
+def read_index(brightdata):
+    """Parsed lines of the record index"""
+    index_path = os.path.join(brightdata.storage_dir, RECORD_INDEX_FILE)
+    with open(index_path) as f:
+        return [json.loads(line) for line in f]
+
+
+def record_path(brightdata, snapshot_id):
+    return os.path.join(brightdata.storage_dir, f"{snapshot_id}.json")
+
+
+def test_list_snapshot_records_uses_index(brightdata, monkeypatch):
+    """Records whose index entry is current are listed without opening the record file"""
+    snapshot_ids = [submit(brightdata, 3), submit(brightdata, 4)]
+    assert [entry["snapshot_id"] for entry in read_index(brightdata)] == snapshot_ids
+
+    monkeypatch.setattr("util.brightdata._load_json_file", lambda path: pytest.fail(f"opened {path}"))
+    records = brightdata.list_snapshot_records()
+
+    assert sorted(record["snapshot_id"] for record in records) == sorted(snapshot_ids)
+    assert all(record["status"] == "submitted" for record in records)
+    assert "mtime_ns" not in records[0]
+
+
+def test_list_snapshot_records_prefers_latest_index_entry(brightdata):
+    """A record updated through the filter is listed with its latest indexed status"""
+    snapshot_id = submit(brightdata, 4)
+    brightdata.update_snapshot_record(snapshot_id, metadata={"status": "ready"})
+
+    assert [entry["status"] for entry in read_index(brightdata)] == ["submitted", "ready"]
+    assert brightdata.list_snapshot_records()[0]["status"] == "ready"
+
+
+def test_list_snapshot_records_rereads_stale_entries(brightdata):
+    """A record changed by another tool (new mtime) is re-read instead of trusting the index"""
+    snapshot_id = submit(brightdata, 4)
+    path = record_path(brightdata, snapshot_id)
+    with open(path) as f:
+        record = json.load(f)
+    record["status"] = "downloaded"
+    with open(path, "w") as f:
+        json.dump(record, f)
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    assert brightdata.list_snapshot_records()[0]["status"] == "downloaded"
+    # The index was rewritten with the re-read entry
+    assert [(entry["status"], entry["mtime_ns"]) for entry in read_index(brightdata)] == [
+        ("downloaded", 1_000_000_000)]
+
+
+def test_list_snapshot_records_without_index(brightdata):
+    """Records missing from the index (e.g. written before it existed) are read and indexed"""
+    snapshot_ids = [submit(brightdata, 3), submit(brightdata, 4)]
+    os.remove(os.path.join(brightdata.storage_dir, RECORD_INDEX_FILE))
+
+    records = brightdata.list_snapshot_records()
+
+    assert sorted(record["snapshot_id"] for record in records) == sorted(snapshot_ids)
+    assert sorted(entry["snapshot_id"] for entry in read_index(brightdata)) == sorted(snapshot_ids)
+
+
+def test_list_snapshot_records_drops_deleted_records(brightdata):
+    """Deleted record files disappear from the listing and from the compacted index"""
+    kept, deleted = submit(brightdata, 3), submit(brightdata, 4)
+    os.remove(record_path(brightdata, deleted))
+
+    assert [record["snapshot_id"] for record in brightdata.list_snapshot_records()] == [kept]
+
+    # Once another entry is stale the index is rewritten without the deleted record
+    os.utime(record_path(brightdata, kept), ns=(1_000_000_000, 1_000_000_000))
+    brightdata.list_snapshot_records()
+    assert [entry["snapshot_id"] for entry in read_index(brightdata)] == [kept]
+
+
+def test_list_snapshot_records_compacts_index(brightdata):
+    """An index grown past twice the record count is rewritten with one line per record"""
+    snapshot_id = submit(brightdata, 4)
+    for progress in range(20):
+        brightdata.update_snapshot_record(snapshot_id, metadata={"status": "building", "progress": progress})
+    brightdata.update_snapshot_record(snapshot_id, metadata={"status": "ready"})
+    assert len(read_index(brightdata)) == 22
+
+    assert brightdata.list_snapshot_records()[0]["status"] == "ready"
+    index = read_index(brightdata)
+    assert [(entry["snapshot_id"], entry["status"]) for entry in index] == [(snapshot_id, "ready")]
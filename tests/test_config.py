@@ -0,0 +1,122 @@
+"""
+Tests for util.config YAML loading and caching.
+
+Each test runs in its own temporary project directory, so the real
+secrets.yaml is never read or written.
+"""
+
+import os
+
+import pytest
+
+import util.config as config
+from util.config import ConfigManager
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    """Empty project root (marked by .gitignore) with a clean YAML cache"""
+    (tmp_path / ".gitignore").write_text("")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, "_YAML_CACHE", {})
+    return tmp_path
+
+
+def write_yaml(path, text, mtime_ns):
+    """Write a YAML file and pin its mtime, so tests don't depend on clock resolution"""
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_yaml_cache_shared_while_unchanged(project_dir):
+    """New managers reuse the parsed secrets while the file is unchanged"""
+    write_yaml(project_dir / "secrets.yaml", "brightdata:\n  api_key: abc\n", 1_000_000_000)
+
+    assert ConfigManager().load_secrets() is ConfigManager().load_secrets()
+    assert len(config._YAML_CACHE) == 1
+
+
+@pytest.mark.parametrize("new_text, new_mtime_ns", [
+    ("brightdata:\n  api_key: abcd\n", 1_000_000_000),  # Same mtime, different size
+    ("brightdata:\n  api_key: xyz\n", 2_000_000_000),   # Same size, different mtime
+])
+def test_yaml_cache_rereads_edited_file(project_dir, new_text, new_mtime_ns):
+    """An edited file is parsed again and the entry for its old version is evicted"""
+    secrets_path = project_dir / "secrets.yaml"
+    write_yaml(secrets_path, "brightdata:\n  api_key: abc\n", 1_000_000_000)
+    assert ConfigManager().get_secret("brightdata.api_key") == "abc"
+
+    write_yaml(secrets_path, new_text, new_mtime_ns)
+    assert ConfigManager().get_secret("brightdata.api_key") == new_text.split()[-1]
+
+    st = secrets_path.stat()
+    assert list(config._YAML_CACHE) == [(str(secrets_path.resolve()), st.st_mtime_ns, st.st_size)]
+
+
+def test_sidecar_is_opt_in(project_dir):
+    """By default no cache file is written next to the config file"""
+    write_yaml(project_dir / "config.yaml", "environment:\n  debug: true\n", 1_000_000_000)
+
+    assert ConfigManager(config_file="config.yaml").get_config("environment.debug") is True
+    assert not (project_dir / "config.yaml.cache").exists()
+
+
+def test_sidecar_never_used_for_secrets(project_dir):
+    """Secrets are not copied to a sidecar file even when the sidecar is enabled"""
+    write_yaml(project_dir / "secrets.yaml", "brightdata:\n  api_key: abc\n", 1_000_000_000)
+
+    assert ConfigManager(sidecar_cache=True).get_secret("brightdata.api_key") == "abc"
+    assert not (project_dir / "secrets.yaml.cache").exists()
+
+
+def test_sidecar_reused_while_unchanged(project_dir, monkeypatch):
+    """A fresh process with an unchanged config file loads the sidecar instead of parsing"""
+    write_yaml(project_dir / "config.yaml", "environment:\n  timeout: 10\n", 1_000_000_000)
+    ConfigManager(config_file="config.yaml", sidecar_cache=True).load_config()
+    assert (project_dir / "config.yaml.cache").exists()
+
+    # Simulate a new process: empty in-memory cache, and no YAML parsing allowed
+    monkeypatch.setattr(config, "_YAML_CACHE", {})
+    monkeypatch.setattr(config.yaml, "load", lambda *args, **kwargs: pytest.fail("YAML was parsed"))
+    manager = ConfigManager(config_file="config.yaml", sidecar_cache=True)
+    assert manager.get_config("environment.timeout") == 10
+
+
+@pytest.mark.parametrize("new_text, new_mtime_ns", [
+    ("environment:\n  timeout: 20\n", 1_000_000_000),  # Same mtime, different size
+    ("environment:\n  timeout: 30\n", 2_000_000_000),  # Same size, different mtime
+])
+def test_sidecar_invalidated_by_mtime_or_size(project_dir, monkeypatch, new_text, new_mtime_ns):
+    """A sidecar stamped with another mtime or size is ignored and rewritten"""
+    config_path = project_dir / "config.yaml"
+    write_yaml(config_path, "environment:\n  timeout: 5\n", 1_000_000_000)
+    ConfigManager(config_file="config.yaml", sidecar_cache=True).load_config()
+
+    write_yaml(config_path, new_text, new_mtime_ns)
+    monkeypatch.setattr(config, "_YAML_CACHE", {})
+    expected = int(new_text.split(":")[-1])
+    assert ConfigManager(config_file="config.yaml", sidecar_cache=True).get_config("environment.timeout") == expected
+
+    # The rewritten sidecar now serves the new contents
+    monkeypatch.setattr(config, "_YAML_CACHE", {})
+    monkeypatch.setattr(config.yaml, "load", lambda *args, **kwargs: pytest.fail("YAML was parsed"))
+    assert ConfigManager(config_file="config.yaml", sidecar_cache=True).get_config("environment.timeout") == expected
+
+
+def test_sidecar_skipped_for_unmarshallable_values(project_dir):
+    """Documents marshal can't store (YAML dates) load normally without a sidecar"""
+    write_yaml(project_dir / "config.yaml", "environment:\n  since: 2024-01-01\n", 1_000_000_000)
+
+    since = ConfigManager(config_file="config.yaml", sidecar_cache=True).get_config("environment.since")
+    assert since.isoformat() == "2024-01-01"
+    assert not (project_dir / "config.yaml.cache").exists()
+    assert not (project_dir / "config.yaml.cache.tmp").exists()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file permissions")
+def test_sidecar_is_owner_only(project_dir):
+    """The sidecar is created readable and writable by its owner only"""
+    write_yaml(project_dir / "config.yaml", "environment:\n  timeout: 10\n", 1_000_000_000)
+    ConfigManager(config_file="config.yaml", sidecar_cache=True).load_config()
+
+    assert (project_dir / "config.yaml.cache").stat().st_mode & 0o777 == 0o600
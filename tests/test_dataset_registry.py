@@ -0,0 +1,26 @@
+"""
+Tests for the dataset registry.
+"""
+
+from dataclasses import replace
+
+from util.dataset_registry import FieldDefinition, FieldType, dataset_registry
+from util.filter_criteria import get_dataset_fields
+
+
+def test_register_dataset_refreshes_shared_fields():
+    """Replacing a dataset's schema rebuilds the filter fields shared for it"""
+    dataset_id = "gd_lk122xxgf86xf97py"
+    schema = dataset_registry.get_dataset(dataset_id)
+    assert get_dataset_fields(dataset_id).schema is schema
+
+    extended = replace(schema, fields={**schema.fields, "new_field": FieldDefinition(
+        "new_field", FieldType.NUMERIC, "Added after startup", "1")})
+    dataset_registry.register_dataset(extended)
+    try:
+        fields = get_dataset_fields(dataset_id)
+        assert fields.schema is extended
+        assert "new_field" in fields.get_field_names()
+    finally:
+        dataset_registry.register_dataset(schema)
+    assert get_dataset_fields(dataset_id).schema is schema
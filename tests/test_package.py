@@ -0,0 +1,25 @@
+"""
+Tests for the util package's lazily loaded exports.
+"""
+
+import subprocess
+import sys
+
+import util
+
+
+def test_all_exports_resolve():
+    """Every name in util.__all__ resolves, so `from util import *` works"""
+    missing = [name for name in util.__all__ if not hasattr(util, name)]
+    assert missing == []
+    assert set(util.__all__) <= set(dir(util))
+
+
+def test_submodules_available_after_import_util():
+    """util.brightdata.X works after a plain `import util`, as with the old eager imports"""
+    code = ("import util, sys; "
+            "assert 'util.brightdata' not in sys.modules; "
+            "assert util.brightdata.BrightDataFilter is util.BrightDataFilter; "
+            "assert util.config.ConfigManager is util.ConfigManager; "
+            "assert util.dataset_registry.__class__.__name__ != 'module'")
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -13,16 +13,14 @@ Date: 2025-01-16
 """
 
 import sys
-import os
-from pathlib import Path
 
-# Add parent directory to path to import util modules
-current_dir = Path(__file__).parent
-parent_dir = current_dir.parent
-sys.path.insert(0, str(parent_dir))
+import pytest
 
 from walmart_strategy_queries import WalmartStrategyQueries
 
+# These submit real queries to BrightData
+pytestmark = pytest.mark.integration
+
 def test_recent_good_selling_strategy():
     """Test the recent good selling products strategy"""
     
@@ -6,107 +6,96 @@ This script tests the updated competitive intelligence dashboard that now includ
 the Recent Good Selling Products Strategy as the second query instead of the old
 "New Product Launches" query.
 
+The dashboard is run once per module against a fake BrightData transport (see
+conftest.py) and each check is its own test. The live API is only exercised by
+the `integration` test.
+
 Author: Derek
 Date: 2025-01-16
 """
 
+import asyncio
 import sys
-import os
-from pathlib import Path
 
-# Add parent directory to path to import util modules
-current_dir = Path(__file__).parent
-parent_dir = current_dir.parent
-sys.path.insert(0, str(parent_dir))
+import pytest
 
 from walmart_strategy_queries import WalmartStrategyQueries
 
-def test_competitive_intelligence_dashboard():
-    """Test the updated competitive intelligence dashboard"""
-    
-    print("🧪 Testing Updated Competitive Intelligence Dashboard")
-    print("=" * 60)
-    
-    # Initialize strategy queries
+EXPECTED_QUERIES = ("price_advantage", "recent_good_selling", "stockout_opportunities")
+
+
+@pytest.fixture(scope="module")
+def intelligence_queries(offline_strategy_queries):
+    """Run the competitive intelligence dashboard once for all tests in this module"""
+    queries = asyncio.run(offline_strategy_queries.competitive_intelligence_dashboard_async())
+    assert isinstance(queries, dict)
+    assert "error" not in queries, queries.get("error")
+    return queries
+
+
+def test_has_expected_queries(intelligence_queries):
+    """Price Advantage, Recent Good Selling and Stockout queries are all submitted"""
+    assert tuple(intelligence_queries) == EXPECTED_QUERIES
+
+
+def test_has_recent_good_selling(intelligence_queries):
+    """The Recent Good Selling Products Strategy is the second dashboard query"""
+    assert list(intelligence_queries).index("recent_good_selling") == 1
+
+
+def test_no_legacy_new_products(intelligence_queries):
+    """The old 'New Product Launches' query has been replaced"""
+    assert "new_products" not in intelligence_queries
+
+
+def test_all_have_snapshot_ids(intelligence_queries):
+    """Every query returned a snapshot ID"""
+    for query_name, result in intelligence_queries.items():
+        assert isinstance(result, dict), f"{query_name}: {result}"
+        assert result.get("snapshot_id"), f"{query_name}: {result}"
+
+
+def test_sync_dashboard_inside_running_loop(offline_strategy_queries, intelligence_queries):
+    """The sync dashboard works where an event loop is already running (e.g. Jupyter)"""
+    async def from_notebook_cell():
+        return offline_strategy_queries.competitive_intelligence_dashboard()
+
+    queries = asyncio.run(from_notebook_cell())
+    assert tuple(queries) == EXPECTED_QUERIES
+    for query_name, result in queries.items():
+        assert result.get("snapshot_id") == intelligence_queries[query_name]["snapshot_id"], query_name
+
+
+def test_failed_query_returns_exception(offline_strategy_queries, monkeypatch):
+    """A failing query comes back as its exception without discarding the others"""
+    brightdata_filter = offline_strategy_queries.brightdata_filter
+    submit = brightdata_filter.search_data_cached
+
+    def search_data_cached(filter_obj, records_limit=1000, description=None, title=None):
+        if title == "Stockout Opportunities":
+            raise Exception("API request failed: HTTP 500")
+        return submit(filter_obj, records_limit, description, title)
+
+    monkeypatch.setattr(brightdata_filter, "search_data_cached", search_data_cached)
+    queries = offline_strategy_queries.competitive_intelligence_dashboard()
+
+    assert isinstance(queries["stockout_opportunities"], Exception)
+    assert str(queries["stockout_opportunities"]) == "API request failed: HTTP 500"
+    assert queries["price_advantage"].get("snapshot_id")
+    assert "Error - API request failed: HTTP 500" in offline_strategy_queries.generate_strategy_report(queries)
+
+
+@pytest.mark.integration
+def test_live_dashboard_returns_snapshot_ids():
+    """Submit the dashboard queries to the live BrightData API"""
     strategy_queries = WalmartStrategyQueries()
-    
-    if not strategy_queries.brightdata_filter:
-        print("❌ Error: Could not initialize BrightData filter")
-        print("Please check your API key in secrets.yaml")
-        return False
-    
-    print("✅ BrightData filter initialized successfully")
-    print()
-    
-    # Test the competitive intelligence dashboard
-    print("📊 Testing Competitive Intelligence Dashboard...")
-    print("Expected queries:")
-    print("1. Price Advantage Analysis")
-    print("2. Recent Good Selling Products Strategy (NEW)")
-    print("3. Stockout Opportunities")
-    print()
-    
-    intelligence_queries = strategy_queries.competitive_intelligence_dashboard()
-    
-    if isinstance(intelligence_queries, dict) and "error" not in intelligence_queries:
-        print("✅ Competitive Intelligence Dashboard executed successfully!")
-        print()
-        print("📋 Generated Queries:")
-        
-        for query_name, result in intelligence_queries.items():
-            if isinstance(result, dict) and "snapshot_id" in result:
-                snapshot_id = result["snapshot_id"]
-                print(f"  • {query_name.replace('_', ' ').title()}: {snapshot_id}")
-            else:
-                print(f"  • {query_name.replace('_', ' ').title()}: {result}")
-        
-        print()
-        
-        # Verify the new query is present
-        if "recent_good_selling" in intelligence_queries:
-            print("✅ Recent Good Selling Products Strategy is included!")
-        else:
-            print("❌ Recent Good Selling Products Strategy is missing!")
-            return False
-        
-        # Verify the old query is not present
-        if "new_products" not in intelligence_queries:
-            print("✅ Old 'New Product Launches' query has been replaced!")
-        else:
-            print("❌ Old 'New Product Launches' query still exists!")
-            return False
-        
-        return True
-    else:
-        print(f"❌ Competitive Intelligence Dashboard failed: {intelligence_queries}")
-        return False
-
-def main():
-    """Run the test"""
-    
-    print("🚀 Updated Competitive Intelligence Dashboard Test")
-    print("=" * 60)
-    
-    success = test_competitive_intelligence_dashboard()
-    
-    print("\n📊 Test Results Summary:")
-    print("=" * 30)
-    print(f"Updated dashboard test: {'✅ PASS' if success else '❌ FAIL'}")
-    
-    if success:
-        print("\n🎉 Test passed! The Recent Good Selling Products Strategy")
-        print("   has been successfully integrated into the Competitive")
-        print("   Intelligence Dashboard as the second query.")
-        print("\n📋 Next Steps:")
-        print("1. Download the snapshot data using the provided snapshot IDs")
-        print("2. Analyze the Recent Good Selling Products results")
-        print("3. Compare with other intelligence queries")
-        print("4. Implement strategic recommendations")
-    else:
-        print("\n⚠️  Test failed. Please check the error messages above.")
-    
-    return success
+    assert strategy_queries.brightdata_filter, "Could not initialize BrightData filter, check secrets.yaml"
+
+    queries = asyncio.run(strategy_queries.competitive_intelligence_dashboard_async())
+    assert tuple(queries) == EXPECTED_QUERIES, queries
+    for query_name, result in queries.items():
+        assert isinstance(result, dict) and result.get("snapshot_id"), f"{query_name}: {result}"
+
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, "-q"]))
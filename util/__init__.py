@@ -5,53 +5,86 @@ This package contains core functionality for data filtering, analysis, and strat
 using the BrightData API across multiple datasets.
 """
 
-from .brightdata import (
-    BrightDataFilter,
-    FilterOperator,
-    LogicalOperator,
-    FilterCondition,
-    FilterGroup,
-    export_filter_to_json,
-    load_filter_from_json,
-    analyze_filter_results
-)
+import importlib
 
+# Loaded eagerly: the submodule shares its name with the registry object, and
+# a later submodule import would otherwise leave util.dataset_registry bound to
+# the module. It only depends on the standard library.
+from .dataset_registry import dataset_registry
 
-from .config import (
-    ConfigManager,
-    config_manager,
-    get_secret,
-    get_config,
-    get_brightdata_api_key,
-    validate_required_secrets
-)
+# Submodules are imported on first attribute access (PEP 562), so importing one
+# name from util doesn't pay for every submodule and its dependencies.
+_SUBMODULE_EXPORTS = {
+    'brightdata': (
+        'BrightDataFilter',
+        'FilterOperator',
+        'LogicalOperator',
+        'FilterCondition',
+        'FilterGroup',
+        'export_filter_to_json',
+        'load_filter_from_json',
+        'analyze_filter_results'
+    ),
+    'config': (
+        'ConfigManager',
+        'config_manager',
+        'get_secret',
+        'get_config',
+        'get_brightdata_api_key',
+        'validate_required_secrets'
+    ),
+    'filter_criteria': (
+        'FilterFields',
+        'DatasetFilterFields',
+        'get_dataset_fields',
+        'AMAZON_FIELDS',
+        'AMAZON_WALMART_FIELDS',
+        'SHOPEE_FIELDS',
+        # Direct callable fields (backward compatibility)
+        'TITLE', 'ASIN', 'BRAND', 'DESCRIPTION', 'CATEGORIES',
+        'INITIAL_PRICE', 'FINAL_PRICE', 'CURRENCY', 'DISCOUNT',
+        'RATING', 'REVIEWS_COUNT', 'AVAILABILITY', 'DELIVERY', 'IS_AVAILABLE',
+        'SELLER_NAME', 'BUYBOX_SELLER', 'NUMBER_OF_SELLERS',
+        'BS_RANK', 'ROOT_BS_RANK', 'DEPARTMENT', 'ITEM_WEIGHT',
+        'PRODUCT_DIMENSIONS', 'MODEL_NUMBER', 'MANUFACTURER', 'UPC'
+    ),
+    'snapshot_cache': (
+        'TTLCache',
+        'ttl_cache',
+        'filter_cache_key'
+    ),
+    'dataset_registry': (
+        'get_dataset_schema',
+        'list_available_datasets',
+        'get_field_reference',
+        'validate_field_operator',
+        'get_dataset_id',
+        'list_dataset_names',
+        'list_datasets_comprehensive'
+    ),
+}
 
-from .filter_criteria import (
-    FilterFields,
-    DatasetFilterFields,
-    AMAZON_FIELDS,
-    AMAZON_WALMART_FIELDS,
-    SHOPEE_FIELDS,
-    # Direct callable fields (backward compatibility)
-    TITLE, ASIN, BRAND, DESCRIPTION, CATEGORIES,
-    INITIAL_PRICE, FINAL_PRICE, CURRENCY, DISCOUNT,
-    RATING, REVIEWS_COUNT, AVAILABILITY, DELIVERY, IS_AVAILABLE,
-    SELLER_NAME, BUYBOX_SELLER, NUMBER_OF_SELLERS,
-    BS_RANK, ROOT_BS_RANK, DEPARTMENT, ITEM_WEIGHT,
-    PRODUCT_DIMENSIONS, MODEL_NUMBER, MANUFACTURER, UPC
-)
+_LAZY = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
 
-from .dataset_registry import (
-    dataset_registry,
-    get_dataset_schema,
-    list_available_datasets,
-    get_field_reference,
-    validate_field_operator,
-    get_dataset_id,
-    list_dataset_names
-)
 
-__all__ = [
+def __getattr__(name):
+    if name in _SUBMODULE_EXPORTS:
+        # The submodules themselves (util.brightdata.X), as with the old eager imports;
+        # importing one binds it on the package
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULE_EXPORTS) | set(_LAZY))
+
+
+__all__ = (
     'BrightDataFilter',
     'FilterOperator', 
     'LogicalOperator',
@@ -66,8 +99,12 @@ __all__ = [
     'get_config',
     'get_brightdata_api_key',
     'validate_required_secrets',
+    'TTLCache',
+    'ttl_cache',
+    'filter_cache_key',
     'FilterFields',
     'DatasetFilterFields',
+    'get_dataset_fields',
     'AMAZON_FIELDS',
     'AMAZON_WALMART_FIELDS',
     'SHOPEE_FIELDS',
@@ -86,4 +123,4 @@ __all__ = [
     'SELLER_NAME', 'BUYBOX_SELLER', 'NUMBER_OF_SELLERS',
     'BS_RANK', 'ROOT_BS_RANK', 'DEPARTMENT', 'ITEM_WEIGHT',
     'PRODUCT_DIMENSIONS', 'MODEL_NUMBER', 'MANUFACTURER', 'UPC'
-]
+)
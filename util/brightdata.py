@@ -5,16 +5,119 @@ This module provides the base classes and functionality for filtering data
 using the BrightData Marketplace Dataset API across multiple datasets.
 """
 
+import asyncio
+import copy
+import io
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import random
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Union
+from dataclasses import dataclass, field
 from enum import Enum
-from .dataset_registry import get_dataset_schema, validate_field_operator, get_dataset_id
+from .dataset_registry import get_dataset_schema, get_dataset_id
+from .snapshot_cache import ttl_cache, filter_cache_key
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing and serialization
+    orjson = None
+
+
+def _load_json_file(path: str) -> Any:
+    """Read and parse a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _parse_response(response: requests.Response, failure: str) -> Any:
+    """
+    Return the JSON body of a successful response, or raise with the API's error.
+    
+    Args:
+        response: Response from the BrightData API
+        failure: Message prefix for the raised exception
+    """
+    if response.ok:
+        try:
+            return orjson.loads(response.content) if orjson is not None else response.json()
+        except ValueError as e:
+            # orjson's and requests' JSONDecodeError are both ValueErrors
+            raise Exception(f"{failure}: invalid JSON body (HTTP {response.status_code}): {e}")
+    # Get the actual error response from the API
+    try:
+        error_details = response.json()
+        error_message = f"HTTP {response.status_code}: {error_details}"
+    except ValueError:
+        error_message = f"HTTP {response.status_code}: {response.text}"
+    raise Exception(f"{failure}: {error_message}")
+
+
+def _dump_json_file(path: str, obj: Any, pretty: bool = False) -> None:
+    """Write obj to path as JSON (compact unless pretty), using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None))
+    else:
+        # UTF-8 without escaping, matching orjson (and _json_bytes) byte for byte
+        with open(path, 'w', encoding='utf-8') as f:
+            if pretty:
+                json.dump(obj, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(obj, f, separators=(',', ':'), ensure_ascii=False)
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Compact UTF-8 JSON encoding of obj, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+RECORD_INDEX_FILE = "index.jsonl"
+_RECORD_SUMMARY_KEYS = ("snapshot_id", "submission_time", "status", "dataset_id", 
+                        "records_limit", "completion_time")
+
+
+def _record_summary(snapshot_id: str, record: Dict[str, Any]) -> Dict[str, Any]:
+    """Summary of a snapshot record as listed by list_snapshot_records"""
+    summary = {key: record.get(key) for key in _RECORD_SUMMARY_KEYS}
+    summary["snapshot_id"] = snapshot_id
+    return summary
+
+
+class _slot_cached:
+    """
+    cached_property for slots dataclasses: the value is computed once and
+    stored in the '<name>_cache' field, which the class must declare.
+    """
+    
+    def __init__(self, func):
+        self.func = func
+        self.slot = f"{func.__name__}_cache"
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if value is None:
+            value = self.func(obj)
+            object.__setattr__(obj, self.slot, value)
+        return value
+
+
+def _cache_field():
+    """Dataclass field holding a _slot_cached value; not part of init, repr or equality"""
+    return field(default=None, init=False, repr=False, compare=False)
 
 
 class FilterOperator(Enum):
@@ -41,15 +144,17 @@ class LogicalOperator(Enum):
     OR = "or"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FilterCondition:
-    """Represents a single filter condition"""
+    """Represents a single filter condition (immutable)"""
     name: str
     operator: FilterOperator
     value: Any = None
+    _api_dict_cache: Optional[Dict[str, Any]] = _cache_field()
+    _api_json_cache: Optional[bytes] = _cache_field()
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert filter condition to API format"""
+    @_slot_cached
+    def _api_dict(self) -> Dict[str, Any]:
         result = {
             "name": self.name,
             "operator": self.operator.value
@@ -58,21 +163,34 @@ class FilterCondition:
             result["value"] = self.value
         return result
     
+    @_slot_cached
+    def _api_json(self) -> bytes:
+        return _json_bytes(self._api_dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert filter condition to API format (a copy the caller may modify)"""
+        return copy.deepcopy(self._api_dict)
+    
     def __and__(self, other: Union['FilterCondition', 'FilterGroup']) -> 'FilterGroup':
         """Override & operator for AND operations - combines into single AND group"""
         if isinstance(other, (FilterCondition, FilterGroup)):
             # If other is already an AND group, add self to it
             if isinstance(other, FilterGroup) and other.operator == LogicalOperator.AND:
-                return FilterGroup(LogicalOperator.AND, [self] + other.filters)
+                return FilterGroup(LogicalOperator.AND, (self,) + other.filters)
             # Otherwise create new AND group
             else:
-                return FilterGroup(LogicalOperator.AND, [self, other])
+                return FilterGroup(LogicalOperator.AND, (self, other))
         return NotImplemented
     
     def __or__(self, other: Union['FilterCondition', 'FilterGroup']) -> 'FilterGroup':
-        """Override | operator for OR operations"""
+        """Override | operator for OR operations - combines into single OR group"""
         if isinstance(other, (FilterCondition, FilterGroup)):
-            return FilterGroup(LogicalOperator.OR, [self, other])
+            # If other is already an OR group, add self to it
+            if isinstance(other, FilterGroup) and other.operator == LogicalOperator.OR:
+                return FilterGroup(LogicalOperator.OR, (self,) + other.filters)
+            # Otherwise create new OR group
+            else:
+                return FilterGroup(LogicalOperator.OR, (self, other))
         return NotImplemented
     
     def __add__(self, other: Union['FilterCondition', 'FilterGroup']) -> 'FilterGroup':
@@ -90,19 +208,35 @@ class FilterCondition:
         return f"FilterCondition(name='{self.name}', operator={self.operator}, value={self.value})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FilterGroup:
-    """Represents a group of filters with logical operator"""
+    """Represents a group of filters with logical operator (immutable)"""
     operator: LogicalOperator
-    filters: List[Union['FilterGroup', FilterCondition]]
+    filters: Tuple[Union['FilterGroup', FilterCondition], ...]
+    _api_dict_cache: Optional[Dict[str, Any]] = _cache_field()
+    _api_json_cache: Optional[bytes] = _cache_field()
+    _pretty_cache: Optional[str] = _cache_field()
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert filter group to API format"""
+    def __post_init__(self):
+        # Accept any iterable of filters, but store a tuple so the group can't change
+        # after its API dict has been cached
+        object.__setattr__(self, 'filters', tuple(self.filters))
+    
+    @_slot_cached
+    def _api_dict(self) -> Dict[str, Any]:
         return {
             "operator": self.operator.value,
-            "filters": [f.to_dict() for f in self.filters]
+            "filters": [f._api_dict for f in self.filters]
         }
     
+    @_slot_cached
+    def _api_json(self) -> bytes:
+        return _json_bytes(self._api_dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert filter group to API format (a copy the caller may modify)"""
+        return copy.deepcopy(self._api_dict)
+    
     def __and__(self, other: Union['FilterCondition', 'FilterGroup']) -> 'FilterGroup':
         """Override & operator for AND operations - combines into single AND group"""
         if isinstance(other, (FilterCondition, FilterGroup)):
@@ -112,19 +246,31 @@ class FilterGroup:
                 return FilterGroup(LogicalOperator.AND, self.filters + other.filters)
             # If self is AND group, add other to it
             elif isinstance(self, FilterGroup) and self.operator == LogicalOperator.AND:
-                return FilterGroup(LogicalOperator.AND, self.filters + [other])
+                return FilterGroup(LogicalOperator.AND, self.filters + (other,))
             # If other is AND group, add self to it
             elif isinstance(other, FilterGroup) and other.operator == LogicalOperator.AND:
-                return FilterGroup(LogicalOperator.AND, [self] + other.filters)
+                return FilterGroup(LogicalOperator.AND, (self,) + other.filters)
             # Otherwise create new AND group
             else:
-                return FilterGroup(LogicalOperator.AND, [self, other])
+                return FilterGroup(LogicalOperator.AND, (self, other))
         return NotImplemented
     
     def __or__(self, other: Union['FilterCondition', 'FilterGroup']) -> 'FilterGroup':
-        """Override | operator for OR operations"""
+        """Override | operator for OR operations - combines into single OR group"""
         if isinstance(other, (FilterCondition, FilterGroup)):
-            return FilterGroup(LogicalOperator.OR, [self, other])
+            # If both are OR groups, combine their filters
+            if (self.operator == LogicalOperator.OR and
+                isinstance(other, FilterGroup) and other.operator == LogicalOperator.OR):
+                return FilterGroup(LogicalOperator.OR, self.filters + other.filters)
+            # If self is OR group, add other to it
+            elif self.operator == LogicalOperator.OR:
+                return FilterGroup(LogicalOperator.OR, self.filters + (other,))
+            # If other is OR group, add self to it
+            elif isinstance(other, FilterGroup) and other.operator == LogicalOperator.OR:
+                return FilterGroup(LogicalOperator.OR, (self,) + other.filters)
+            # Otherwise create new OR group
+            else:
+                return FilterGroup(LogicalOperator.OR, (self, other))
         return NotImplemented
     
     def __add__(self, other: Union['FilterCondition', 'FilterGroup']) -> 'FilterGroup':
@@ -133,31 +279,42 @@ class FilterGroup:
     
     def __str__(self) -> str:
         """Human-readable string representation - uses pretty print by default"""
-        return self.pretty_print()
+        return self._pretty
     
     def __repr__(self) -> str:
         """Developer representation"""
         return f"FilterGroup(operator={self.operator}, filters={len(self.filters)} items)"
     
+    @_slot_cached
+    def _pretty(self) -> str:
+        return self.pretty_print()
+    
     def pretty_print(self, indent: int = 0) -> str:
         """Pretty print with indentation for complex nested filters"""
+        buf = io.StringIO()
+        self._render(buf, indent)
+        return buf.getvalue()
+    
+    def _render(self, buf: io.StringIO, indent: int) -> None:
+        """Write the pretty-printed group into buf"""
         prefix = "  " * indent
         
         if len(self.filters) == 1:
-            return f"{prefix}{self.filters[0]}"
+            buf.write(prefix)
+            buf.write(str(self.filters[0]))
+            return
         
-        lines = [f"{prefix}("]
+        separator = f"{prefix}  {self.operator.value.upper()}\n"
+        buf.write(f"{prefix}(\n")
         for i, filter_item in enumerate(self.filters):
+            if i:
+                buf.write(separator)
             if isinstance(filter_item, FilterGroup):
-                lines.append(filter_item.pretty_print(indent + 1))
+                filter_item._render(buf, indent + 1)
             else:
-                lines.append(f"{prefix}  {filter_item}")
-            
-            if i < len(self.filters) - 1:
-                lines.append(f"{prefix}  {self.operator.value.upper()}")
-        
-        lines.append(f"{prefix})")
-        return "\n".join(lines)
+                buf.write(f"{prefix}  {filter_item}")
+            buf.write("\n")
+        buf.write(f"{prefix})")
 
 
 class BrightDataFilter:
@@ -177,8 +334,9 @@ class BrightDataFilter:
             storage_dir: Directory to store snapshot records (default: "snapshot_records")
             api_key: BrightData API key (optional, will load from secrets if not provided)
         """
-        # Load API key from secrets if not provided
-        if api_key is None:
+        # Load API key from secrets if not provided (an empty key would only
+        # earn a 401 on every request)
+        if not api_key:
             from .config import get_brightdata_api_key
             self.api_key = get_brightdata_api_key()
         else:
@@ -196,6 +354,16 @@ class BrightDataFilter:
             "Content-Type": "application/json"
         }
         
+        # Shared session so every API call reuses pooled keep-alive connections
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504],
+                              raise_on_status=False)
+        ))
+        self._session.headers.update(self.headers)
+        
         # Setup local storage directory
         self.storage_dir = storage_dir
         os.makedirs(self.storage_dir, exist_ok=True)
@@ -205,9 +373,24 @@ class BrightDataFilter:
         if not self.schema:
             raise ValueError(f"Unknown dataset ID: {self.dataset_id}. Available datasets: {self._get_available_datasets()}")
         
-        # Create filter fields for this dataset
-        from .filter_criteria import DatasetFilterFields
-        self.filter = DatasetFilterFields(self.dataset_id)
+        # Filter fields for this dataset (shared across instances)
+        from .filter_criteria import get_dataset_fields
+        self.fields = get_dataset_fields(self.dataset_id)
+        
+        # Valid (field, operator) pairs, so create_filter checks a set instead of the registry
+        self._valid_pairs = frozenset(
+            (field_name, op) for field_name, field_def in self.schema.fields.items() for op in field_def.operators
+        )
+    
+    def close(self) -> None:
+        """Close the pooled HTTP connections"""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def _get_available_datasets(self) -> List[str]:
         """Get list of available dataset IDs"""
@@ -232,7 +415,8 @@ class BrightDataFilter:
     def create_filter(self, 
                      name: str, 
                      operator: Union[FilterOperator, str], 
-                     value: Any = None) -> FilterCondition:
+                     value: Any = None,
+                     validate: bool = True) -> FilterCondition:
         """
         Create a single filter condition.
         
@@ -240,6 +424,9 @@ class BrightDataFilter:
             name: Field name to filter on
             operator: Filter operator (FilterOperator enum or string)
             value: Filter value (not required for is_null/is_not_null)
+            validate: Check the field and operator now; pass False when building
+                many conditions and check the finished tree once with
+                validate_tree (or search_data(..., validate=True)) instead
             
         Returns:
             FilterCondition object
@@ -255,50 +442,51 @@ class BrightDataFilter:
                 raise ValueError(f"Invalid operator '{operator}'. Valid operators: {[op.value for op in FilterOperator]}")
         
         # Validate field and operator combination
-        if not validate_field_operator(self.dataset_id, name, operator.value):
-            available_fields = self.schema.get_field_names()
-            field_def = self.schema.get_field(name)
-            if not field_def:
-                raise ValueError(f"Field '{name}' not found in dataset '{self.dataset_id}'. Available fields: {available_fields}")
-            else:
-                raise ValueError(f"Operator '{operator.value}' not supported for field '{name}'. Supported operators: {field_def.operators}")
+        if validate and (name, operator.value) not in self._valid_pairs:
+            raise self._invalid_filter_error(name, operator)
         
         return FilterCondition(name, operator, value)
     
-    def filter(self, field: str, op: str, value: Any = None) -> FilterCondition:
+    def _invalid_filter_error(self, name: str, operator: FilterOperator) -> ValueError:
+        """Build the error for a field/operator pair this dataset doesn't support"""
+        field_def = self.schema.get_field(name)
+        if not field_def:
+            available_fields = self.schema.get_field_names()
+            return ValueError(f"Field '{name}' not found in dataset '{self.dataset_id}'. Available fields: {available_fields}")
+        return ValueError(f"Operator '{operator.value}' not supported for field '{name}'. Supported operators: {field_def.operators}")
+    
+    def validate_tree(self, filter_obj: Union[FilterCondition, FilterGroup]) -> None:
         """
-        Convenience method to create filters with string operators.
+        Check every condition in a filter against this dataset in one walk.
         
         Args:
-            field: Field name to filter on
-            op: Operator as string (e.g., ">=", "=", "in", "array_includes")
-            value: Filter value
+            filter_obj: Filter condition or group
             
-        Returns:
-            FilterCondition object
+        Raises:
+            ValueError: On the first field or operator that is not valid for this dataset
         """
-        # Map string operators to FilterOperator enum
-        op_map = {
-            "=": FilterOperator.EQUAL,
-            "!=": FilterOperator.NOT_EQUAL,
-            "<": FilterOperator.LESS_THAN,
-            "<=": FilterOperator.LESS_THAN_EQUAL,
-            ">": FilterOperator.GREATER_THAN,
-            ">=": FilterOperator.GREATER_THAN_EQUAL,
-            "in": FilterOperator.IN,
-            "not_in": FilterOperator.NOT_IN,
-            "includes": FilterOperator.INCLUDES,
-            "not_includes": FilterOperator.NOT_INCLUDES,
-            "array_includes": FilterOperator.ARRAY_INCLUDES,
-            "not_array_includes": FilterOperator.NOT_ARRAY_INCLUDES,
-            "is_null": FilterOperator.IS_NULL,
-            "is_not_null": FilterOperator.IS_NOT_NULL
-        }
+        valid_pairs = self._valid_pairs
+        stack = [filter_obj]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, FilterGroup):
+                stack.extend(node.filters)
+            elif (node.name, node.operator.value) not in valid_pairs:
+                raise self._invalid_filter_error(node.name, node.operator)
+    
+    @property
+    def filter(self):
+        """
+        Filter fields for this dataset, also callable with string operators.
         
-        if op not in op_map:
-            raise ValueError(f"Unknown operator: {op}. Available: {list(op_map.keys())}")
+        Both styles build a FilterCondition:
+            bd.filter.rating >= 4.5
+            bd.filter("rating", ">=", "4.5")
         
-        return FilterCondition(field, op_map[op], value)
+        Returns:
+            DatasetFilterFields for this dataset (same object as self.fields)
+        """
+        return self.fields
     
     def create_filter_group(self, 
                            operator: LogicalOperator, 
@@ -331,13 +519,12 @@ class BrightDataFilter:
             # Get all local snapshot records
             snapshot_files = list(Path(self.storage_dir).glob("*.json"))
             
-            # Convert filter to comparable format
-            current_filter_dict = filter_obj.to_dict()
+            # Convert filter to comparable format (the cached dict; only read here)
+            current_filter_dict = filter_obj._api_dict
             
             for snapshot_file in snapshot_files:
                 try:
-                    with open(snapshot_file, 'r') as f:
-                        record = json.load(f)
+                    record = _load_json_file(snapshot_file)
                     
                     # Skip if record is None or empty
                     if not record:
@@ -391,10 +578,19 @@ class BrightDataFilter:
                     normalized = {}
                     for key, value in f.items():
                         if key == 'filters' and isinstance(value, list):
+                            items = []
+                            for item in value:
+                                item = normalize_filter(item)
+                                # Splice in nested groups with the same operator, as FilterGroup's
+                                # & and | do, so records saved before OR chains were flattened
+                                # still match the flat dicts built now
+                                if (isinstance(item, dict) and isinstance(item.get('filters'), list)
+                                        and item.get('operator') == f.get('operator')):
+                                    items.extend(item['filters'])
+                                else:
+                                    items.append(item)
                             # For filter lists, sort by a consistent key to handle reordering
-                            # Create a sort key based on the filter content
-                            sorted_filters = sorted(value, key=lambda x: self._get_filter_sort_key(x))
-                            normalized[key] = [normalize_filter(item) for item in sorted_filters]
+                            normalized[key] = sorted(items, key=self._get_filter_sort_key)
                         elif isinstance(value, list):
                             # For other lists, recursively normalize each item
                             normalized[key] = [normalize_filter(item) for item in value]
@@ -436,7 +632,8 @@ class BrightDataFilter:
                     filter_obj: Union[FilterCondition, FilterGroup], 
                     records_limit: int = 1000,
                     description: str = None,
-                    title: str = None) -> Dict[str, Any]:
+                    title: str = None,
+                    validate: bool = False) -> Dict[str, Any]:
         """
         Execute the search with the provided filter and save local record.
         Checks for existing snapshots with the same conditions to avoid duplicates.
@@ -445,10 +642,20 @@ class BrightDataFilter:
             filter_obj: Filter condition or group
             records_limit: Maximum number of records to return
             description: Optional description of what this snapshot contains
+            validate: Check every condition against the dataset schema (validate_tree)
+                before submitting, instead of leaving it to the API
             
         Returns:
             API response with snapshot_id and local record path
+            
+        Raises:
+            ValueError: If validate is set and a field or operator in the filter
+                is not valid for this dataset
         """
+        if validate:
+            # Fail fast locally rather than spending an API call on an invalid filter
+            self.validate_tree(filter_obj)
+        
         # Check for existing snapshots with the same conditions
         existing_snapshot = self._find_existing_snapshot(filter_obj, records_limit)
         if existing_snapshot:
@@ -464,49 +671,139 @@ class BrightDataFilter:
                 "existing": True
             }
         
-        # No existing snapshot found, submit new query
-        payload = {
-            "dataset_id": self.dataset_id,
-            "records_limit": records_limit,
-            "filter": filter_obj.to_dict()
-        }
+        # No existing snapshot found, submit new query. The filter's JSON is
+        # encoded once and cached on the (immutable) filter object, so repeated
+        # submissions only encode the two scalar fields around it
+        payload = b'{"dataset_id":%s,"records_limit":%s,"filter":%s}' % (
+            _json_bytes(self.dataset_id), _json_bytes(records_limit), filter_obj._api_json)
         
         try:
-            response = requests.post(
+            # Content-Type is set on the session
+            response = self._session.post(
                 f"{self.base_url}/filter",
-                headers=self.headers,
-                json=payload,
+                data=payload,
                 timeout=30
             )
-            response.raise_for_status()
-            api_response = response.json()
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"API request failed: {str(e)}")
+        api_response = _parse_response(response, "API request failed")
+        
+        # Save local record
+        snapshot_id = api_response.get("snapshot_id")
+        if snapshot_id:
+            submission_time = datetime.now().isoformat()
+            record_path = self._save_snapshot_record(snapshot_id, filter_obj, records_limit, submission_time, description, title)
             
-            # Save local record
-            snapshot_id = api_response.get("snapshot_id")
-            if snapshot_id:
-                submission_time = datetime.now().isoformat()
-                record_path = self._save_snapshot_record(snapshot_id, filter_obj, records_limit, submission_time, description, title)
-                
-                # Add local record info to response
-                api_response["local_record_path"] = record_path
-                api_response["submission_time"] = submission_time
-                
-                print(f"📝 Local record saved: {record_path}")
-                print(f"🆔 Snapshot ID: {snapshot_id}")
-                print(f"⏰ Submitted at: {submission_time}")
+            # Add local record info to response
+            api_response["local_record_path"] = record_path
+            api_response["submission_time"] = submission_time
             
-            return api_response
+            print(f"📝 Local record saved: {record_path}")
+            print(f"🆔 Snapshot ID: {snapshot_id}")
+            print(f"⏰ Submitted at: {submission_time}")
+        
+        return api_response
+    
+    @ttl_cache(maxsize=256, ttl=3600, copy_result=True,
+               key=lambda self, filter_obj, records_limit=1000, description=None, title=None:
+                   (self.storage_dir, self.api_key, description, title)
+                   + filter_cache_key(self.dataset_id, filter_obj._api_dict, records_limit))
+    def search_data_cached(self, 
+                           filter_obj: Union[FilterCondition, FilterGroup], 
+                           records_limit: int = 1000,
+                           description: str = None,
+                           title: str = None) -> Dict[str, Any]:
+        """
+        Same as search_data, but an identical filter submitted again within an
+        hour (with the same API key, storage directory, title and description)
+        returns a copy of the earlier response without scanning local records
+        or calling the API. Identical submissions made at the same time are
+        only sent once.
+        """
+        return self.search_data(filter_obj, records_limit, description, title)
+    
+    def search_data_batch(self, 
+                          queries: List[Dict[str, Any]], 
+                          max_workers: int = 4,
+                          cached: bool = False) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Execute several searches in one call.
+        
+        The filter endpoint accepts a single filter per request, so the
+        submissions are sent concurrently and the batch costs roughly one
+        round trip instead of one per query. Queries with the same filter and
+        records limit are submitted once, as search_data would reuse the first
+        snapshot if they ran in turn; the duplicates get a copy of its result.
+        
+        Args:
+            queries: List of search_data keyword arguments (filter_obj, records_limit, ...)
+            max_workers: Maximum number of concurrent submissions
+            cached: Submit through search_data_cached instead of search_data
             
-        except requests.exceptions.HTTPError as e:
-            # Get the actual error response from the API
+        Returns:
+            List of API responses in the same order as queries; a failed
+            submission is returned as its exception
+        """
+        if not queries:
+            return []
+        
+        # Concurrent copies of one filter would all miss _find_existing_snapshot
+        # and each submit a paid snapshot, so send each distinct filter once
+        unique_queries = []
+        unique_index = {}
+        positions = []
+        for query in queries:
+            digest = filter_cache_key(self.dataset_id, query['filter_obj']._api_dict,
+                                      query.get('records_limit', 1000))
+            if digest not in unique_index:
+                unique_index[digest] = len(unique_queries)
+                unique_queries.append(query)
+            positions.append(unique_index[digest])
+        
+        search = self.search_data_cached if cached else self.search_data
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_queries))) as executor:
+            futures = [executor.submit(search, **query) for query in unique_queries]
+        
+        unique_results = []
+        for future in futures:
             try:
-                error_details = response.json()
-                error_message = f"HTTP {response.status_code}: {error_details}"
-            except:
-                error_message = f"HTTP {response.status_code}: {response.text}"
-            raise Exception(f"API request failed: {error_message}")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"API request failed: {str(e)}")
+                unique_results.append(future.result())
+            except Exception as e:
+                unique_results.append(e)
+        
+        results = []
+        returned = set()
+        for index in positions:
+            result = unique_results[index]
+            if index in returned and isinstance(result, dict):
+                result = copy.copy(result)
+            returned.add(index)
+            results.append(result)
+        return results
+    
+    def search_many(self, 
+                    filter_objs: List[Union[FilterCondition, FilterGroup]], 
+                    records_limit: int = 1000,
+                    max_workers: int = 8,
+                    cached: bool = False) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Submit several filters with the same records limit.
+        
+        Shorthand for search_data_batch: the submissions (and their local
+        record writes) overlap on the pooled session.
+        
+        Args:
+            filter_objs: Filter conditions or groups to submit
+            records_limit: Maximum number of records per snapshot
+            max_workers: Maximum number of concurrent submissions
+            cached: Submit through search_data_cached instead of search_data
+            
+        Returns:
+            List of API responses in the same order as filter_objs; a failed
+            submission is returned as its exception
+        """
+        queries = [{"filter_obj": filter_obj, "records_limit": records_limit} for filter_obj in filter_objs]
+        return self.search_data_batch(queries, max_workers=max_workers, cached=cached)
     
     def _save_snapshot_record(self, snapshot_id: str, filter_obj: Union[FilterCondition, FilterGroup], 
                              records_limit: int, submission_time: str, description: str = None, 
@@ -548,8 +845,7 @@ class BrightDataFilter:
         }
         
         file_path = os.path.join(self.storage_dir, f"{snapshot_id}.json")
-        with open(file_path, 'w') as f:
-            json.dump(record, f, indent=2)
+        self._flush_record(file_path, record)
         
         return file_path
     
@@ -635,23 +931,13 @@ class BrightDataFilter:
             Snapshot metadata including status, size, cost, etc.
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/snapshots/{snapshot_id}",
-                headers=self.headers,
                 timeout=30
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
-            # Get the actual error response from the API
-            try:
-                error_details = response.json()
-                error_message = f"HTTP {response.status_code}: {error_details}"
-            except:
-                error_message = f"HTTP {response.status_code}: {response.text}"
-            raise Exception(f"Failed to get snapshot metadata: {error_message}")
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to get snapshot metadata: {str(e)}")
+        return _parse_response(response, "Failed to get snapshot metadata")
     
     def deliver_snapshot(self, snapshot_id: str, delivery_config: Dict[str, Any]) -> Dict[str, Any]:
         """Deliver a snapshot using the BrightData API
@@ -679,9 +965,8 @@ class BrightDataFilter:
             result = brightdata.deliver_snapshot("snap_123", config)
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/snapshots/{snapshot_id}/deliver",
-                headers=self.headers,
                 json=delivery_config,
                 timeout=30
             )
@@ -725,9 +1010,8 @@ class BrightDataFilter:
             if part is not None:
                 params["part"] = part
             
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/snapshots/{snapshot_id}/download",
-                headers=self.headers,
                 params=params,
                 timeout=60,  # Longer timeout for downloads
                 stream=True
@@ -737,28 +1021,63 @@ class BrightDataFilter:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to download snapshot content: {str(e)}")
     
-    def update_snapshot_record(self, snapshot_id: str, metadata: Dict[str, Any] = None, 
-                              error: str = None) -> Dict[str, Any]:
-        """
-        Update the local snapshot record with metadata or error information.
+    def _download_snapshot_part(self, snapshot_id: str, batch_size: int, part: int) -> List[Dict[str, Any]]:
+        """Download one batch of a snapshot as JSON records"""
+        response = self.download_snapshot_content(snapshot_id, format="json", 
+                                                  batch_size=batch_size, part=part)
+        return response.json()
+    
+    async def iter_snapshot_async(self, snapshot_id: str, batch_size: int = 1000, 
+                                  concurrency: int = 8):
+        """Iterate over the records of a ready snapshot, downloading batches concurrently
+        
+        The batch count is taken from the snapshot's dataset_size. Up to
+        `concurrency` batches are fetched at once over the pooled session,
+        and records are yielded batch by batch as each download finishes,
+        so their order across batches is not preserved.
         
         Args:
-            snapshot_id: The snapshot ID to update
-            metadata: Snapshot metadata from the API
-            error: Error message if the snapshot failed
+            snapshot_id: The snapshot ID to download
+            batch_size: Number of records per batch
+            concurrency: Maximum number of batches downloaded at once
             
-        Returns:
-            Updated record data
+        Yields:
+            Snapshot records as dictionaries
+            
+        Example:
+            async for record in brightdata.iter_snapshot_async("snap_123"):
+                print(record["title"])
         """
-        file_path = os.path.join(self.storage_dir, f"{snapshot_id}.json")
+        metadata = await asyncio.to_thread(self.get_snapshot_metadata, snapshot_id)
+        dataset_size = metadata.get('dataset_size')
+        if not isinstance(dataset_size, int) or dataset_size <= batch_size:
+            # Unknown or small size: a single download covers it
+            response = await asyncio.to_thread(self.download_snapshot_content, snapshot_id, "json")
+            for record in await asyncio.to_thread(response.json):
+                yield record
+            return
         
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"No local record found for snapshot {snapshot_id}")
+        semaphore = asyncio.Semaphore(concurrency)
         
-        with open(file_path, 'r') as f:
-            record = json.load(f)
+        async def fetch(part: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await asyncio.to_thread(self._download_snapshot_part, snapshot_id, batch_size, part)
         
-        # Update record with new information
+        parts = -(-dataset_size // batch_size)
+        tasks = [asyncio.create_task(fetch(part)) for part in range(1, parts + 1)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                for record in await task:
+                    yield record
+        finally:
+            # Stop outstanding downloads if the caller breaks out early or a batch fails
+            for task in tasks:
+                task.cancel()
+    
+    @staticmethod
+    def _apply_record_update(record: Dict[str, Any], metadata: Dict[str, Any] = None, 
+                             error: str = None) -> None:
+        """Apply snapshot metadata or an error to a record dict in place"""
         if metadata:
             record["metadata"] = metadata
             record["status"] = metadata.get("status", "unknown")
@@ -769,10 +1088,80 @@ class BrightDataFilter:
             record["error"] = error
             record["status"] = "error"
             record["completion_time"] = datetime.now().isoformat()
+    
+    @staticmethod
+    def _flush_record(file_path: str, record: Dict[str, Any]) -> None:
+        """
+        Write a record atomically, so readers never see a half-written file,
+        and append its summary to the directory's record index.
+        """
+        tmp_path = f"{file_path}.tmp"
+        _dump_json_file(tmp_path, record)
+        # os.replace keeps the temp file's mtime, which tags the index entry
+        mtime_ns = os.stat(tmp_path).st_mtime_ns
+        os.replace(tmp_path, file_path)
+        
+        snapshot_id = os.path.basename(file_path)[:-5]  # Remove .json extension
+        entry = _record_summary(snapshot_id, record)
+        entry["mtime_ns"] = mtime_ns
+        # One short O_APPEND write per line, so concurrent writers don't interleave
+        with open(os.path.join(os.path.dirname(file_path), RECORD_INDEX_FILE), 'ab') as f:
+            f.write(_json_bytes(entry) + b"\n")
+    
+    @staticmethod
+    def _poll_delay(attempt: int, check_interval: float, remaining: float) -> float:
+        """Seconds to wait before the next status check of a snapshot"""
+        # Short jobs are noticed within seconds, long ones settle at check_interval;
+        # jitter keeps many concurrent waits from polling in lockstep
+        delay = min(check_interval, 2 * 1.5 ** attempt) * random.uniform(0.8, 1.2)
+        return max(0.0, min(delay, remaining))
+    
+    def _record_tracker(self, snapshot_id: str):
+        """
+        Load a snapshot's local record once and return a function that keeps it updated.
+        
+        The returned track(metadata=None, error=None, final=False) applies an
+        update in memory and only writes the file when the status changes or
+        final is set. It does nothing if there is no local record.
+        """
+        file_path = os.path.join(self.storage_dir, f"{snapshot_id}.json")
+        try:
+            record = _load_json_file(file_path)
+        except FileNotFoundError:
+            record = None  # No local record to keep in sync
+        
+        def track(metadata: Dict[str, Any] = None, error: str = None, final: bool = False) -> None:
+            if record is None:
+                return
+            previous_status = record.get("status")
+            self._apply_record_update(record, metadata, error)
+            if final or record["status"] != previous_status:
+                self._flush_record(file_path, record)
+        
+        return track
+    
+    def update_snapshot_record(self, snapshot_id: str, metadata: Dict[str, Any] = None, 
+                              error: str = None) -> Dict[str, Any]:
+        """
+        Update the local snapshot record with metadata or error information.
+        
+        Args:
+            snapshot_id: The snapshot ID to update
+            metadata: Snapshot metadata from the API
+            error: Error message if the snapshot failed
+            
+        Returns:
+            Updated record data
+        """
+        file_path = os.path.join(self.storage_dir, f"{snapshot_id}.json")
+        
+        try:
+            record = _load_json_file(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No local record found for snapshot {snapshot_id}") from None
         
-        # Save updated record
-        with open(file_path, 'w') as f:
-            json.dump(record, f, indent=2)
+        self._apply_record_update(record, metadata, error)
+        self._flush_record(file_path, record)
         
         return record
     
@@ -782,18 +1171,31 @@ class BrightDataFilter:
         Wait for a snapshot to complete processing and return the final metadata.
         Updates the local record with progress and final results.
         
+        The record is read once and kept in memory while polling; it is only
+        written back when the status changes and when the wait ends.
+        
         Args:
             snapshot_id: The snapshot ID to monitor
             max_wait_time: Maximum time to wait in seconds (default: 30 minutes)
-            check_interval: Time between status checks in seconds (default: 30 seconds)
+            check_interval: Maximum time between status checks in seconds (default: 30 seconds).
+                Checks start 2s apart and back off by 1.5x (with jitter) up to this cap.
             
         Returns:
             Final snapshot metadata when ready or failed
         """
         start_time = time.time()
+        attempt = 0
+        
+        def next_delay() -> float:
+            nonlocal attempt
+            delay = self._poll_delay(attempt, check_interval, max_wait_time - (time.time() - start_time))
+            attempt += 1
+            return delay
+        
+        track = self._record_tracker(snapshot_id)
         
         print(f"🔍 Monitoring snapshot {snapshot_id}...")
-        print(f"⏰ Max wait time: {max_wait_time//60} minutes, Check interval: {check_interval} seconds")
+        print(f"⏰ Max wait time: {max_wait_time//60} minutes, Check interval: up to {check_interval} seconds")
         
         while time.time() - start_time < max_wait_time:
             try:
@@ -801,7 +1203,7 @@ class BrightDataFilter:
                 status = metadata.get('status', 'unknown')
                 
                 # Update local record with current status
-                self.update_snapshot_record(snapshot_id, metadata=metadata)
+                track(metadata, final=status in ('ready', 'failed'))
                 
                 print(f"📊 Status: {status} (elapsed: {int((time.time() - start_time)//60)}m {int((time.time() - start_time)%60)}s)")
                 
@@ -816,25 +1218,100 @@ class BrightDataFilter:
                     print(f"❌ Snapshot failed: {error_msg}")
                     return metadata
                 elif status in ['scheduled', 'building']:
-                    print(f"⏳ Processing... waiting {check_interval}s...")
-                    time.sleep(check_interval)
+                    delay = next_delay()
+                    print(f"⏳ Processing... waiting {delay:.0f}s...")
+                    time.sleep(delay)
                 else:
                     print(f"⚠️ Unknown status: {status}")
-                    time.sleep(check_interval)
+                    time.sleep(next_delay())
                     
             except Exception as e:
                 print(f"⚠️ Error checking status: {e}")
-                time.sleep(check_interval)
+                time.sleep(next_delay())
         
         print(f"⏰ Timeout reached ({max_wait_time//60} minutes). Final status:")
         try:
             final_metadata = self.get_snapshot_metadata(snapshot_id)
-            self.update_snapshot_record(snapshot_id, metadata=final_metadata)
+            track(final_metadata, final=True)
             return final_metadata
         except Exception as e:
-            self.update_snapshot_record(snapshot_id, error=str(e))
+            track(error=str(e), final=True)
             raise e
     
+    async def wait_for_many_async(self, snapshot_ids: List[str], max_wait_time: int = 1800, 
+                                  check_interval: int = 30, 
+                                  concurrency: int = 8) -> Dict[str, Any]:
+        """
+        Wait for several snapshots at once and return their final metadata.
+        
+        All snapshots are polled concurrently on one event loop, with the same
+        backoff as wait_for_snapshot_completion. Status requests go through the
+        pooled session in worker threads, at most `concurrency` at a time, and
+        each snapshot's local record is kept updated as its status changes.
+        
+        Args:
+            snapshot_ids: The snapshot IDs to monitor
+            max_wait_time: Maximum time to wait in seconds, shared by all snapshots
+            check_interval: Maximum time between status checks of one snapshot in seconds
+            concurrency: Maximum number of status requests in flight
+            
+        Returns:
+            Dict mapping each snapshot ID to its final metadata, or to the
+            exception raised by its last status check
+        """
+        start_time = time.time()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def poll(snapshot_id: str) -> Dict[str, Any]:
+            track = await asyncio.to_thread(self._record_tracker, snapshot_id)
+            attempt = 0
+            
+            async def check(final: bool = False) -> Dict[str, Any]:
+                async with semaphore:
+                    metadata = await asyncio.to_thread(self.get_snapshot_metadata, snapshot_id)
+                status = metadata.get('status', 'unknown')
+                if status != previous_status:
+                    print(f"📊 {snapshot_id}: {status} (elapsed: {int(time.time() - start_time)}s)")
+                await asyncio.to_thread(track, metadata, None, final or status in ('ready', 'failed'))
+                return metadata
+            
+            previous_status = None
+            while time.time() - start_time < max_wait_time:
+                try:
+                    metadata = await check()
+                    previous_status = metadata.get('status', 'unknown')
+                    if previous_status in ('ready', 'failed'):
+                        return metadata
+                except Exception as e:
+                    print(f"⚠️ {snapshot_id}: error checking status: {e}")
+                await asyncio.sleep(self._poll_delay(attempt, check_interval, 
+                                                     max_wait_time - (time.time() - start_time)))
+                attempt += 1
+            
+            # Timed out: record the last status as final, like wait_for_snapshot_completion
+            try:
+                return await check(final=True)
+            except Exception as e:
+                await asyncio.to_thread(track, None, str(e), True)
+                raise
+        
+        snapshot_ids = list(dict.fromkeys(snapshot_ids))
+        print(f"🔍 Monitoring {len(snapshot_ids)} snapshots...")
+        results = await asyncio.gather(*(poll(snapshot_id) for snapshot_id in snapshot_ids), 
+                                       return_exceptions=True)
+        return dict(zip(snapshot_ids, results))
+    
+    def wait_for_many(self, snapshot_ids: List[str], max_wait_time: int = 1800, 
+                      check_interval: int = 30, concurrency: int = 8) -> Dict[str, Any]:
+        """
+        Wait for several snapshots at once (sync wrapper around wait_for_many_async).
+        
+        Must not be called from a running event loop; await
+        wait_for_many_async there instead.
+        """
+        return asyncio.run(self.wait_for_many_async(snapshot_ids, max_wait_time, 
+                                                    check_interval, concurrency))
+    
     def get_snapshot_record(self, snapshot_id: str) -> Dict[str, Any]:
         """
         Get the local record for a snapshot.
@@ -850,36 +1327,69 @@ class BrightDataFilter:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"No local record found for snapshot {snapshot_id}")
         
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        return _load_json_file(file_path)
     
     def list_snapshot_records(self) -> List[Dict[str, Any]]:
         """
         List all local snapshot records.
         
+        Summaries come from the record index (index.jsonl) written alongside
+        the records; a record file is only opened when it has no index entry
+        or was modified since (e.g. by another tool). The index is compacted
+        when it has grown stale.
+        
         Returns:
             List of snapshot records with basic info
         """
+        index_path = os.path.join(self.storage_dir, RECORD_INDEX_FILE)
+        index = {}
+        index_lines = 0
+        try:
+            with open(index_path, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = orjson.loads(line) if orjson is not None else json.loads(line)
+                    except ValueError:
+                        continue  # Torn line from an interrupted append
+                    index[entry.get("snapshot_id")] = entry  # Later lines win
+                    index_lines += 1
+        except FileNotFoundError:
+            pass
+        
         records = []
+        entries = {}
+        stale = False
         
-        for filename in os.listdir(self.storage_dir):
-            if filename.endswith('.json'):
-                snapshot_id = filename[:-5]  # Remove .json extension
+        # scandir yields the file type with each entry, so no extra stat per file
+        with os.scandir(self.storage_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                if not dir_entry.name.endswith('.json') or not dir_entry.is_file(follow_symlinks=False):
+                    continue
+                snapshot_id = dir_entry.name[:-5]  # Remove .json extension
                 try:
-                    record = self.get_snapshot_record(snapshot_id)
-                    records.append({
-                        "snapshot_id": snapshot_id,
-                        "submission_time": record.get("submission_time"),
-                        "status": record.get("status"),
-                        "dataset_id": record.get("dataset_id"),
-                        "records_limit": record.get("records_limit"),
-                        "completion_time": record.get("completion_time")
-                    })
+                    mtime_ns = dir_entry.stat().st_mtime_ns
+                    entry = index.get(snapshot_id)
+                    if entry is None or entry.get("mtime_ns") != mtime_ns:
+                        stale = True
+                        entry = _record_summary(snapshot_id, _load_json_file(dir_entry.path))
+                        entry["mtime_ns"] = mtime_ns
+                    entries[snapshot_id] = entry
+                    records.append({key: entry.get(key) for key in _RECORD_SUMMARY_KEYS})
                 except Exception as e:
-                    print(f"⚠️ Error reading record {filename}: {e}")
+                    print(f"⚠️ Error reading record {dir_entry.name}: {e}")
+        
+        if stale or index_lines > 2 * len(entries) + 16:
+            # Rewrite the index with one current line per record
+            try:
+                tmp_path = f"{index_path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(b"".join(_json_bytes(entry) + b"\n" for entry in entries.values()))
+                os.replace(tmp_path, index_path)
+            except OSError as e:
+                print(f"⚠️ Could not update record index: {e}")
         
         # Sort by submission time (newest first)
-        records.sort(key=lambda x: x.get("submission_time", ""), reverse=True)
+        records.sort(key=lambda x: x["submission_time"] or "", reverse=True)
         return records
     
     def get_field_reference(self) -> Dict[str, str]:
@@ -959,8 +1469,7 @@ def export_filter_to_json(filter_obj: Union[FilterCondition, FilterGroup],
         filter_obj: Filter condition or group to export
         filename: Output filename
     """
-    with open(filename, 'w') as f:
-        json.dump(filter_obj.to_dict(), f, indent=2)
+    _dump_json_file(filename, filter_obj.to_dict(), pretty=True)
     print(f"Filter configuration exported to {filename}")
 
 
@@ -974,8 +1483,7 @@ def load_filter_from_json(filename: str) -> Dict[str, Any]:
     Returns:
         Filter configuration dictionary
     """
-    with open(filename, 'r') as f:
-        return json.load(f)
+    return _load_json_file(filename)
 
 
 def analyze_filter_results(snapshot_id: str, api_key: str) -> Dict[str, Any]:
@@ -6,27 +6,156 @@ in a secure and organized manner.
 """
 
 import yaml
+import marshal
 import os
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml: pure-Python parser
+    from yaml import SafeLoader as _SafeLoader
+
+
+# Parsed YAML documents keyed on (path, mtime, size), shared by all ConfigManager
+# instances so an unchanged file is only read and parsed once per process
+_YAML_CACHE: Dict[Tuple[str, int, int], Any] = {}
+_YAML_CACHE_LOCK = threading.Lock()
+
+# Dotted key paths split into key tuples, once per distinct path
+_KEY_CACHE: Dict[str, Tuple[str, ...]] = {}
+
+# Key paths read by the fixed-shape accessors
+_K_API_KEY = ('brightdata', 'api_key')
+_K_DATASET_ID = ('brightdata', 'dataset_id')
+_K_BASE_URL = ('brightdata', 'base_url')
+_K_DEBUG = ('environment', 'debug')
+_K_LOG_LEVEL = ('environment', 'log_level')
+_K_MAX_RETRIES = ('environment', 'max_retries')
+_K_TIMEOUT = ('environment', 'timeout')
+
+
+def _split_key_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dot-separated key path, reusing earlier splits"""
+    keys = _KEY_CACHE.get(key_path)
+    if keys is None:
+        keys = _KEY_CACHE[key_path] = tuple(key_path.split('.'))
+    return keys
+
+
+def _get_nested_tuple(data: Any, keys: Tuple[str, ...], default: Any = None) -> Any:
+    """Get a nested value from a dictionary by a tuple of keys, or default if missing"""
+    current = data
+    try:
+        for key in keys:
+            current = current[key]
+        return current
+    except (KeyError, TypeError):
+        return default
+
+
+def _sidecar_path(path: Path) -> Path:
+    """Path of the parsed-document cache kept next to a YAML file"""
+    return path.with_name(path.name + ".cache")
+
+
+def _read_sidecar(path: Path, st: os.stat_result) -> Tuple[bool, Any]:
+    """
+    Read the parsed document from the YAML file's sidecar cache.
+    
+    Returns:
+        (True, document) if the sidecar matches the YAML file's mtime and size,
+        (False, None) otherwise
+    """
+    try:
+        with open(_sidecar_path(path), 'rb') as f:
+            mtime_ns, size, data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return False, None
+    if (mtime_ns, size) != (st.st_mtime_ns, st.st_size):
+        return False, None
+    return True, data
+
+
+def _write_sidecar(path: Path, st: os.stat_result, data: Any) -> None:
+    """
+    Write the parsed document to the YAML file's sidecar cache, if it can be stored.
+    
+    The file is created with owner-only permissions. marshal's format is only
+    guaranteed to load under the interpreter version that wrote it, so after a
+    Python upgrade the sidecar fails to load and is silently rewritten.
+    """
+    sidecar = _sidecar_path(path)
+    tmp_path = sidecar.with_name(sidecar.name + ".tmp")
+    try:
+        blob = marshal.dumps((st.st_mtime_ns, st.st_size, data))
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(blob)
+        os.replace(tmp_path, sidecar)
+    except (OSError, ValueError):
+        # Unwritable directory, or values marshal can't store (e.g. YAML dates):
+        # the YAML file is simply parsed again next time
+        pass
+
+
+def _load_yaml(path: Path, sidecar: bool = False) -> Any:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged.
+    
+    The returned object is shared between callers and should be treated as read-only.
+    
+    Args:
+        path: Path to the YAML file
+        sidecar: Also keep the parsed document in a '<file>.cache' file next to
+            it, so new processes can skip the YAML parse
+        
+    Returns:
+        The parsed YAML document
+    """
+    st = path.stat()
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    if key in _YAML_CACHE:
+        return _YAML_CACHE[key]
+    
+    found, data = _read_sidecar(path, st) if sidecar else (False, None)
+    if not found:
+        with open(path, 'r') as f:
+            data = yaml.load(f, Loader=_SafeLoader)
+        if sidecar:
+            _write_sidecar(path, st, data)
+    
+    with _YAML_CACHE_LOCK:
+        # Drop entries for older versions of this file
+        for stale_key in [k for k in _YAML_CACHE if k[0] == key[0]]:
+            del _YAML_CACHE[stale_key]
+        _YAML_CACHE[key] = data
+    return data
+
 
 class ConfigManager:
     """
     Manages configuration and secrets loading from YAML files.
     """
     
-    def __init__(self, secrets_file: str = "secrets.yaml", config_file: Optional[str] = None):
+    def __init__(self, secrets_file: str = "secrets.yaml", config_file: Optional[str] = None,
+                 sidecar_cache: bool = False):
         """
         Initialize the configuration manager.
         
         Args:
             secrets_file: Path to the secrets YAML file
             config_file: Optional path to a separate config YAML file
+            sidecar_cache: Keep the parsed config file in a '<file>.cache' file
+                next to it so later processes skip the parse (it is refreshed
+                whenever the YAML file changes). Never used for the secrets file,
+                so secrets aren't copied to a second file.
         """
         self.project_root = self._find_project_root()
         self.secrets_file = Path(self.project_root) / secrets_file
         self.config_file = Path(self.project_root) / config_file if config_file else None
+        self.sidecar_cache = sidecar_cache
         self._secrets = None
         self._config = None
     
@@ -63,8 +192,7 @@ class ConfigManager:
                     f"Please copy secrets.example.yaml to secrets.yaml and fill in your values."
                 )
             
-            with open(self.secrets_file, 'r') as f:
-                self._secrets = yaml.safe_load(f)
+            self._secrets = _load_yaml(self.secrets_file)
         
         return self._secrets
     
@@ -83,8 +211,7 @@ class ConfigManager:
             if not self.config_file.exists():
                 raise FileNotFoundError(f"Config file not found: {self.config_file}")
             
-            with open(self.config_file, 'r') as f:
-                self._config = yaml.safe_load(f)
+            self._config = _load_yaml(self.config_file, self.sidecar_cache)
         
         return self._config or {}
     
@@ -128,15 +255,7 @@ class ConfigManager:
         Returns:
             The value or default
         """
-        keys = key_path.split('.')
-        current = data
-        
-        try:
-            for key in keys:
-                current = current[key]
-            return current
-        except (KeyError, TypeError):
-            return default
+        return _get_nested_tuple(data, _split_key_path(key_path), default)
     
     def get_brightdata_config(self) -> Dict[str, str]:
         """
@@ -145,10 +264,11 @@ class ConfigManager:
         Returns:
             Dictionary with BrightData configuration
         """
+        secrets = self.load_secrets()
         return {
-            'api_key': self.get_secret('brightdata.api_key'),
-            'dataset_id': self.get_secret('brightdata.dataset_id', 'gd_l7q7dkf244hwjntr0'),
-            'base_url': self.get_secret('brightdata.base_url', 'https://api.brightdata.com/datasets')
+            'api_key': _get_nested_tuple(secrets, _K_API_KEY),
+            'dataset_id': _get_nested_tuple(secrets, _K_DATASET_ID, 'gd_l7q7dkf244hwjntr0'),
+            'base_url': _get_nested_tuple(secrets, _K_BASE_URL, 'https://api.brightdata.com/datasets')
         }
     
     def get_environment_config(self) -> Dict[str, Any]:
@@ -158,11 +278,12 @@ class ConfigManager:
         Returns:
             Dictionary with environment settings
         """
+        config = self.load_config()
         return {
-            'debug': self.get_config('environment.debug', False),
-            'log_level': self.get_config('environment.log_level', 'INFO'),
-            'max_retries': self.get_config('environment.max_retries', 3),
-            'timeout': self.get_config('environment.timeout', 30)
+            'debug': _get_nested_tuple(config, _K_DEBUG, False),
+            'log_level': _get_nested_tuple(config, _K_LOG_LEVEL, 'INFO'),
+            'max_retries': _get_nested_tuple(config, _K_MAX_RETRIES, 3),
+            'timeout': _get_nested_tuple(config, _K_TIMEOUT, 30)
         }
     
     def validate_secrets(self) -> Dict[str, bool]:
@@ -174,15 +295,16 @@ class ConfigManager:
         """
         secrets = self.load_secrets()
         
-        required_secrets = {
-            'brightdata.api_key': 'BrightData API key',
-            'brightdata.dataset_id': 'BrightData dataset ID'
-        }
+        # (key path, description, placeholder value from secrets.example.yaml)
+        required_secrets = (
+            (_K_API_KEY, 'BrightData API key', 'your_api_key_here'),
+            (_K_DATASET_ID, 'BrightData dataset ID', 'your_dataset_id_here')
+        )
         
         validation = {}
-        for key, description in required_secrets.items():
-            value = self.get_secret(key)
-            validation[description] = value is not None and value != f"your_{key.split('.')[-1]}_here"
+        for keys, description, placeholder in required_secrets:
+            value = _get_nested_tuple(secrets, keys)
+            validation[description] = value is not None and value != placeholder
         
         return validation
 
@@ -5,6 +5,8 @@ This module provides a centralized registry for different datasets, their schema
 and field definitions to support multi-dataset filtering.
 """
 
+import sys
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
@@ -75,6 +77,11 @@ class DatasetRegistry:
     def register_dataset(self, schema: DatasetSchema) -> None:
         """Register a new dataset schema"""
         self._datasets[schema.dataset_id] = schema
+        # Shared filter fields built from a replaced schema are stale. Only needed
+        # once filter_criteria is loaded; importing it here would be circular.
+        filter_criteria = sys.modules.get(f"{__package__}.filter_criteria")
+        if filter_criteria is not None:
+            filter_criteria.get_dataset_fields.cache_clear()
     
     def get_dataset(self, dataset_id: str) -> Optional[DatasetSchema]:
         """Get dataset schema by ID"""
@@ -426,6 +433,7 @@ def validate_field_operator(dataset_id: str, field_name: str, operator: str) ->
     return dataset_registry.validate_field(dataset_id, field_name, operator)
 
 
+@lru_cache(maxsize=64)
 def get_dataset_id(dataset_name: str) -> str:
     """
     Get dataset ID from user-friendly name
@@ -5,14 +5,44 @@ Callable field classes with type-specific methods for intuitive filter creation
 across multiple datasets including Amazon, Walmart, and other product data sources.
 """
 
-from typing import Any, Union, Optional, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Union, Optional, Dict, Mapping
 from .brightdata import FilterCondition, FilterOperator
 from .dataset_registry import dataset_registry, get_dataset_schema
 
 
+def _operator_condition(field_name: str, operator: str, value: Any = None) -> FilterCondition:
+    """
+    Build a FilterCondition from a string operator.
+    
+    Args:
+        field_name: Field name to filter on
+        operator: String operator (e.g., ">=", "=", "in", "array_includes")
+        value: Filter value
+        
+    Returns:
+        FilterCondition object
+        
+    Raises:
+        ValueError: If the operator is unknown
+    """
+    # The string operators are exactly the FilterOperator values, so the
+    # enum's own value lookup does the mapping
+    try:
+        operator_enum = FilterOperator(operator)
+    except ValueError:
+        raise ValueError(f"Unknown operator: {operator}. Available: {[o.value for o in FilterOperator]}") from None
+    
+    return FilterCondition(field_name, operator_enum, value)
+
+
 class FilterField:
     """Base class for filter fields that can be called with operators"""
     
+    # One instance per dataset field is kept for the process lifetime; no __dict__ needed
+    __slots__ = ('field_name',)
+    
     def __init__(self, field_name: str):
         self.field_name = field_name
     
@@ -27,28 +57,7 @@ class FilterField:
         Returns:
             FilterCondition object
         """
-        # Map string operators to FilterOperator enum
-        op_map = {
-            "=": FilterOperator.EQUAL,
-            "!=": FilterOperator.NOT_EQUAL,
-            "<": FilterOperator.LESS_THAN,
-            "<=": FilterOperator.LESS_THAN_EQUAL,
-            ">": FilterOperator.GREATER_THAN,
-            ">=": FilterOperator.GREATER_THAN_EQUAL,
-            "in": FilterOperator.IN,
-            "not_in": FilterOperator.NOT_IN,
-            "includes": FilterOperator.INCLUDES,
-            "not_includes": FilterOperator.NOT_INCLUDES,
-            "array_includes": FilterOperator.ARRAY_INCLUDES,
-            "not_array_includes": FilterOperator.NOT_ARRAY_INCLUDES,
-            "is_null": FilterOperator.IS_NULL,
-            "is_not_null": FilterOperator.IS_NOT_NULL
-        }
-        
-        if operator not in op_map:
-            raise ValueError(f"Unknown operator: {operator}. Available: {list(op_map.keys())}")
-        
-        return FilterCondition(self.field_name, op_map[operator], value)
+        return _operator_condition(self.field_name, operator, value)
     
     def __str__(self):
         return self.field_name
@@ -60,6 +69,8 @@ class FilterField:
 class NumericalFilterField(FilterField):
     """Filter field for numerical values with comparison methods"""
     
+    __slots__ = ()
+    
     def __gt__(self, value: Union[int, float, str]) -> FilterCondition:
         """Greater than: field > value"""
         return FilterCondition(self.field_name, FilterOperator.GREATER_THAN, str(value))
@@ -96,6 +107,8 @@ class NumericalFilterField(FilterField):
 class BooleanFilterField(FilterField):
     """Filter field for boolean values with boolean-specific methods"""
     
+    __slots__ = ()
+    
     def is_true(self) -> FilterCondition:
         """Field is true"""
         return FilterCondition(self.field_name, FilterOperator.EQUAL, True)
@@ -116,6 +129,8 @@ class BooleanFilterField(FilterField):
 class StringFilterField(FilterField):
     """Filter field for string values with string-specific methods"""
     
+    __slots__ = ()
+    
     def contains(self, value: str) -> FilterCondition:
         """String contains value"""
         return FilterCondition(self.field_name, FilterOperator.INCLUDES, value)
@@ -164,6 +179,8 @@ class StringFilterField(FilterField):
 class ArrayFilterField(FilterField):
     """Filter field for array values with array-specific methods"""
     
+    __slots__ = ()
+    
     def includes(self, value: Union[str, list]) -> FilterCondition:
         """
         Array includes value(s).
@@ -208,58 +225,91 @@ class ArrayFilterField(FilterField):
 class DatasetFilterFields:
     """Dataset-aware filter fields factory"""
     
+    __slots__ = ('dataset_id', 'schema', '_fields')
+    
     def __init__(self, dataset_id: str):
         self.dataset_id = dataset_id
         self.schema = get_dataset_schema(dataset_id)
         if not self.schema:
             raise ValueError(f"Unknown dataset ID: {dataset_id}")
         
-        # Create field instances based on schema
-        self._fields: Dict[str, FilterField] = {}
-        self._create_fields()
+        # Create field instances based on schema; read-only once built
+        self._fields: Mapping[str, FilterField] = MappingProxyType(self._create_fields())
     
-    def _create_fields(self):
+    def _create_fields(self) -> Dict[str, FilterField]:
         """Create field instances based on dataset schema"""
+        fields = {}
         for field_name, field_def in self.schema.fields.items():
             if field_def.field_type.value == "numeric":
-                self._fields[field_name] = NumericalFilterField(field_name)
+                fields[field_name] = NumericalFilterField(field_name)
             elif field_def.field_type.value == "boolean":
-                self._fields[field_name] = BooleanFilterField(field_name)
+                fields[field_name] = BooleanFilterField(field_name)
             elif field_def.field_type.value == "array":
-                self._fields[field_name] = ArrayFilterField(field_name)
+                fields[field_name] = ArrayFilterField(field_name)
             else:  # string, object
-                self._fields[field_name] = StringFilterField(field_name)
+                fields[field_name] = StringFilterField(field_name)
+        return fields
     
     def __getattr__(self, name: str) -> FilterField:
         """Get field by name (uppercase convention)"""
+        if name.startswith('_'):
+            # Private/dunder lookups (e.g. _fields before __init__ ran, copy
+            # and pickle protocol probes) are never dataset fields
+            raise AttributeError(name)
         # Convert uppercase to lowercase for field names
         field_name = name.lower()
         if field_name in self._fields:
             return self._fields[field_name]
         raise AttributeError(f"Field '{name}' not found in dataset '{self.dataset_id}'")
     
+    def __call__(self, field: str, op: str, value: Any = None) -> FilterCondition:
+        """
+        Convenience method to create filters with string operators.
+        
+        Args:
+            field: Field name to filter on (not validated against the dataset)
+            op: Operator as string (e.g., ">=", "=", "in", "array_includes")
+            value: Filter value
+            
+        Returns:
+            FilterCondition object
+        """
+        return _operator_condition(field, op, value)
+    
     def get_field(self, field_name: str) -> Optional[FilterField]:
         """Get field by name"""
         return self._fields.get(field_name)
     
     def list_fields(self) -> Dict[str, FilterField]:
         """List all available fields"""
-        return self._fields.copy()
+        return dict(self._fields)
     
     def get_field_names(self) -> list:
         """Get all field names"""
         return list(self._fields.keys())
 
 
+@lru_cache(maxsize=None)
+def get_dataset_fields(dataset_id: str) -> DatasetFilterFields:
+    """
+    Get the shared filter fields for a dataset.
+    
+    The fields are read-only, so one instance per dataset is built and reused
+    by every BrightDataFilter instead of recreating all field objects per filter.
+    register_dataset clears the cache, so a replaced schema gets new fields.
+    """
+    return DatasetFilterFields(dataset_id)
+
+
 # Create dataset-specific field instances
 # Amazon Products Dataset (gd_l7q7dkf244hwjntr0)
-AMAZON_FIELDS = DatasetFilterFields("gd_l7q7dkf244hwjntr0")
+AMAZON_FIELDS = get_dataset_fields("gd_l7q7dkf244hwjntr0")
 
 # Amazon-Walmart Comparison Dataset (gd_m4l6s4mn2g2rkx9lia)
-AMAZON_WALMART_FIELDS = DatasetFilterFields("gd_m4l6s4mn2g2rkx9lia")
+AMAZON_WALMART_FIELDS = get_dataset_fields("gd_m4l6s4mn2g2rkx9lia")
 
 # Shopee Products Dataset (gd_lk122xxgf86xf97py)
-SHOPEE_FIELDS = DatasetFilterFields("gd_lk122xxgf86xf97py")
+SHOPEE_FIELDS = get_dataset_fields("gd_lk122xxgf86xf97py")
 
 # Backward compatibility - use Amazon fields as default
 # This maintains existing code compatibility
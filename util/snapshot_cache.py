@@ -0,0 +1,147 @@
+"""
+In-memory TTL cache for snapshot submissions.
+
+This module provides a small thread-safe time-to-live cache and a decorator
+built on it, used to return the snapshot of an identical filter submission
+without going back to local records or the BrightData API.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Least-recently-used cache whose entries expire after a fixed time-to-live.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+
+def ttl_cache(maxsize: int = 256, ttl: float = 3600,
+              key: Optional[Callable[..., Hashable]] = None,
+              copy_result: bool = False) -> Callable:
+    """
+    Cache a function's results for ttl seconds.
+    
+    Exceptions are not cached. Concurrent calls with the same key wait for
+    the first one instead of all running the function; calls with different
+    keys don't block each other.
+    
+    Args:
+        maxsize: Maximum number of cached results
+        ttl: Seconds a result stays valid
+        key: Optional function building the cache key from the call arguments
+            (defaults to the positional and keyword arguments themselves)
+        copy_result: Return a shallow copy of the cached value on every call, so
+            callers can modify it; otherwise cached values are shared and
+            should be treated as read-only
+        
+    Returns:
+        Decorator; the wrapped function exposes cache and cache_clear()
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = TTLCache(maxsize, ttl)
+        # cache_key -> [lock, number of callers using it] for keys being computed
+        pending = {}
+        pending_lock = threading.Lock()
+        
+        def compute(cache_key, args, kwargs):
+            with pending_lock:
+                entry = pending.get(cache_key)
+                if entry is None:
+                    entry = pending[cache_key] = [threading.Lock(), 0]
+                entry[1] += 1
+            try:
+                with entry[0]:
+                    # Another caller may have stored the value while we waited
+                    value = cache.get(cache_key, _MISSING)
+                    if value is _MISSING:
+                        value = func(*args, **kwargs)
+                        cache[cache_key] = value
+                    return value
+            finally:
+                with pending_lock:
+                    entry[1] -= 1
+                    if not entry[1]:
+                        del pending[cache_key]
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            value = cache.get(cache_key, _MISSING)
+            if value is _MISSING:
+                value = compute(cache_key, args, kwargs)
+            return copy.copy(value) if copy_result else value
+        
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    
+    return decorator
+
+
+def filter_cache_key(dataset_id: str, filter_dict: Dict[str, Any], records_limit: int = None) -> tuple:
+    """
+    Build a stable cache key for a filter submission.
+
+    Args:
+        dataset_id: Dataset the filter runs against
+        filter_dict: Filter in API format (as returned by to_dict())
+        records_limit: Requested records limit
+
+    Returns:
+        Tuple of dataset ID, records limit and a digest of the filter
+    """
+    payload = json.dumps(filter_dict, sort_keys=True, separators=(',', ':'), default=str)
+    digest = hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    return (dataset_id, records_limit, digest)
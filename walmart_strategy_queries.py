@@ -24,6 +24,7 @@ Author: Derek
 Date: 2025-01-16
 """
 
+import asyncio
 import json
 import sys
 import os
@@ -37,6 +38,50 @@ sys.path.insert(0, str(parent_dir))
 
 from util.brightdata import BrightDataFilter
 from util.config import get_brightdata_api_key
+from util.filter_criteria import AMAZON_WALMART_FIELDS
+
+# The dashboard filters only depend on constants, so the filter trees are
+# built once at import instead of on every dashboard load
+F = AMAZON_WALMART_FIELDS
+COMPETITIVE_INTELLIGENCE_QUERIES = {
+    # Price advantage analysis
+    "price_advantage": dict(
+        filter_obj=(
+            (F.price_difference > 5) &
+            (F.is_available_amazon.is_true()) &
+            (F.available_for_delivery_walmart.is_true())
+        ),
+        records_limit=500,
+        description="Products where Walmart has significant price advantage",
+        title="Price Advantage Analysis"
+    ),
+    # Recent good selling products strategy
+    "recent_good_selling": dict(
+        filter_obj=(
+            (F.reviews_count_amazon < 50) &
+            (F.bought_past_month_amazon > 100) &
+            (F.rating_amazon >= 4.0) &
+            (F.is_available_amazon.is_true()) &
+            (F.available_for_delivery_walmart.is_false()) &
+            (F.reviews_count_amazon > 0)  # Ensure there are some reviews for quality indication
+        ),
+        records_limit=500,
+        description="Recent good selling products with <50 reviews but >100 sales last month",
+        title="Recent Good Selling Products Strategy"
+    ),
+    # Stockout opportunities
+    "stockout_opportunities": dict(
+        filter_obj=(
+            (F.availability_amazon.in_list(["out of stock", "unavailable"])) &
+            (F.available_for_delivery_walmart.is_true()) &
+            (F.rating_amazon >= 4.0)
+        ),
+        records_limit=500,
+        description="Amazon stockouts where Walmart has availability",
+        title="Stockout Opportunities"
+    ),
+}
+del F
 
 class WalmartStrategyQueries:
     """
@@ -50,7 +95,7 @@ class WalmartStrategyQueries:
             self.brightdata_filter = BrightDataFilter("amazon_walmart")
             self.dataset_id = "gd_m4l6s4mn2g2rkx9lia"  # Amazon Walmart Dataset
             # Get filter fields for intuitive syntax
-            self.filter = self.brightdata_filter.filter
+            self.filter = self.brightdata_filter.fields
         except Exception as e:
             print(f"Error initializing BrightData filter: {e}")
             self.brightdata_filter = None
@@ -273,59 +318,51 @@ class WalmartStrategyQueries:
         )
     
     
-    def competitive_intelligence_dashboard(self) -> Dict[str, str]:
+    def _competitive_intelligence_queries(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the search_data arguments for each competitive intelligence query
+        
+        Returns:
+            Dictionary of query names and their search_data keyword arguments
+        """
+        return {name: dict(kwargs) for name, kwargs in COMPETITIVE_INTELLIGENCE_QUERIES.items()}
+    
+    def competitive_intelligence_dashboard(self) -> Dict[str, Any]:
         """
         Strategy 8: Comprehensive competitive intelligence queries
         
+        The queries are independent, so they are submitted together through
+        search_data_batch (which runs them on a thread pool) and the dashboard
+        waits for the slowest one rather than the sum of all. Reloading the
+        dashboard within the cache TTL reuses the earlier snapshots. Safe to
+        call from Jupyter, since no event loop is involved.
+        
+        A failed query doesn't discard the others: its entry holds the
+        exception raised by search_data instead of the response, so check
+        results with isinstance(result, Exception).
+        
         Returns:
-            Dictionary of snapshot IDs for different intelligence queries
+            Dictionary of query names and their search_data responses (or exceptions)
         """
         if not self.brightdata_filter or not self.filter:
             return {"error": "BrightData filter not initialized"}
         
-        queries = {}
-        F = self.filter
-        
-        # Price advantage analysis
-        queries["price_advantage"] = self.brightdata_filter.search_data(
-            filter_obj=(
-                (F.price_difference > 5) &
-                (F.is_available_amazon.is_true()) &
-                (F.available_for_delivery_walmart.is_true())
-            ),
-            records_limit=500,
-            description="Products where Walmart has significant price advantage",
-            title="Price Advantage Analysis"
-        )
-        
-        # Recent good selling products strategy
-        queries["recent_good_selling"] = self.brightdata_filter.search_data(
-            filter_obj=(
-                (F.reviews_count_amazon < 50) &
-                (F.bought_past_month_amazon > 100) &
-                (F.rating_amazon >= 4.0) &
-                (F.is_available_amazon.is_true()) &
-                (F.available_for_delivery_walmart.is_false()) &
-                (F.reviews_count_amazon > 0)  # Ensure there are some reviews for quality indication
-            ),
-            records_limit=500,
-            description="Recent good selling products with <50 reviews but >100 sales last month",
-            title="Recent Good Selling Products Strategy"
-        )
+        queries = self._competitive_intelligence_queries()
+        results = self.brightdata_filter.search_data_batch(list(queries.values()), cached=True)
+        return dict(zip(queries, results))
+    
+    async def competitive_intelligence_dashboard_async(self) -> Dict[str, Any]:
+        """
+        Strategy 8: Comprehensive competitive intelligence queries, for use
+        inside an event loop
         
-        # Stockout opportunities
-        queries["stockout_opportunities"] = self.brightdata_filter.search_data(
-            filter_obj=(
-                (F.availability_amazon.in_list(["out of stock", "unavailable"])) &
-                (F.available_for_delivery_walmart.is_true()) &
-                (F.rating_amazon >= 4.0)
-            ),
-            records_limit=500,
-            description="Amazon stockouts where Walmart has availability",
-            title="Stockout Opportunities"
-        )
+        Runs competitive_intelligence_dashboard in a worker thread so the
+        loop isn't blocked while the queries are submitted.
         
-        return queries
+        Returns:
+            Dictionary of query names and their search_data responses (or exceptions)
+        """
+        return await asyncio.to_thread(self.competitive_intelligence_dashboard)
     
     def generate_strategy_report(self, snapshot_ids: Dict[str, str]) -> str:
         """
@@ -338,7 +375,7 @@ class WalmartStrategyQueries:
             Formatted strategy report
         """
         report = "# Walmart Strategic Analysis Report\n\n"
-        report += f"Generated: {json.dumps(snapshot_ids, indent=2)}\n\n"
+        report += f"Generated: {json.dumps(snapshot_ids, indent=2, default=str)}\n\n"
         
         report += "## Strategic Opportunities Identified\n\n"
         
@@ -381,77 +418,60 @@ class WalmartStrategyQueries:
 def main():
     """Example usage of Walmart Strategy Queries"""
     
-    print("🚀 Walmart C-Level Strategic Analysis")
-    print("=" * 50)
+    sys.stdout.write("🚀 Walmart C-Level Strategic Analysis\n" + "=" * 50 + "\n")
     
     # Initialize strategy queries
     strategy_queries = WalmartStrategyQueries()
     
     if not strategy_queries.brightdata_filter:
-        print("❌ Error: Could not initialize BrightData filter")
-        print("Please check your API key in secrets.yaml")
+        sys.stdout.write("❌ Error: Could not initialize BrightData filter\n"
+                         "Please check your API key in secrets.yaml\n")
         return
     
-    print("✅ BrightData filter initialized successfully")
-    print()
+    sys.stdout.write("✅ BrightData filter initialized successfully\n\n"
+                     "📊 Executing strategic queries...\n")
     
-    # Execute strategic queries
-    print("📊 Executing strategic queries...")
+    strategies = [
+        ("sales_opportunity", "Sales Opportunity Capture", strategy_queries.sales_opportunity_capture),
+        ("portfolio_expansion", "Product Portfolio Expansion", strategy_queries.product_portfolio_expansion),
+        ("pricing_optimization", "Pricing Strategy Optimization", strategy_queries.pricing_strategy_optimization),
+        ("category_gaps", "Category Gap Analysis", strategy_queries.category_gap_analysis),
+        ("brand_partnerships", "Brand Partnership Opportunities", strategy_queries.brand_partnership_opportunities),
+        ("trend_analysis", "Seasonal Trend Analysis", strategy_queries.seasonal_trend_analysis),
+        ("premium_products", "Premium Product Strategy", strategy_queries.premium_product_strategy),
+    ]
     
     snapshot_ids = {}
     
-    # Strategy 1: Sales Opportunity Capture
-    print("1. Sales Opportunity Capture...")
-    snapshot_ids["sales_opportunity"] = strategy_queries.sales_opportunity_capture()
-    
-    # Strategy 2: Product Portfolio Expansion
-    print("2. Product Portfolio Expansion...")
-    snapshot_ids["portfolio_expansion"] = strategy_queries.product_portfolio_expansion()
-    
-    # Strategy 3: Pricing Strategy Optimization
-    print("3. Pricing Strategy Optimization...")
-    snapshot_ids["pricing_optimization"] = strategy_queries.pricing_strategy_optimization()
-    
-    # Strategy 4: Category Gap Analysis
-    print("4. Category Gap Analysis...")
-    snapshot_ids["category_gaps"] = strategy_queries.category_gap_analysis()
-    
-    # Strategy 5: Brand Partnership Opportunities
-    print("5. Brand Partnership Opportunities...")
-    snapshot_ids["brand_partnerships"] = strategy_queries.brand_partnership_opportunities()
-    
-    # Strategy 6: Seasonal Trend Analysis
-    print("6. Seasonal Trend Analysis...")
-    snapshot_ids["trend_analysis"] = strategy_queries.seasonal_trend_analysis()
-    
-    # Strategy 7: Premium Product Strategy
-    print("7. Premium Product Strategy...")
-    snapshot_ids["premium_products"] = strategy_queries.premium_product_strategy()
+    # Progress lines are flushed one by one since each query waits on the API
+    for number, (key, name, run_query) in enumerate(strategies, 1):
+        print(f"{number}. {name}...", flush=True)
+        snapshot_ids[key] = run_query()
     
     # Strategy 8: Competitive Intelligence Dashboard (includes Recent Good Selling Products)
-    print("8. Competitive Intelligence Dashboard...")
+    print(f"{len(strategies) + 1}. Competitive Intelligence Dashboard...", flush=True)
     intelligence_queries = strategy_queries.competitive_intelligence_dashboard()
     snapshot_ids.update(intelligence_queries)
     
-    print()
-    print("✅ All strategic queries completed!")
-    print()
-    
-    # Generate and display report
+    # Generate and save report
     report = strategy_queries.generate_strategy_report(snapshot_ids)
-    print(report)
-    
-    # Save report to file
     with open("walmart_strategy_report.md", "w") as f:
         f.write(report)
     
-    print("📄 Strategy report saved to: walmart_strategy_report.md")
-    print()
-    print("🎯 Next Steps:")
-    print("1. Review the generated report")
-    print("2. Download snapshot data using the provided snapshot IDs")
-    print("3. Analyze results and prioritize opportunities")
-    print("4. Implement strategic recommendations")
+    # Display the summary in a single write
+    sys.stdout.write("\n".join([
+        "",
+        "✅ All strategic queries completed!",
+        "",
+        report,
+        "📄 Strategy report saved to: walmart_strategy_report.md",
+        "",
+        "🎯 Next Steps:",
+        "1. Review the generated report",
+        "2. Download snapshot data using the provided snapshot IDs",
+        "3. Analyze results and prioritize opportunities",
+        "4. Implement strategic recommendations",
+    ]) + "\n")
 
 if __name__ == "__main__":
     main()